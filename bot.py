@@ -1,25 +1,39 @@
+import asyncio
+import bisect
+import functools
+import heapq
 import logging
+import math
 import os
+import random
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AbstractSet, Callable, Dict, List, Optional, Sequence
 
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 from dotenv import load_dotenv
 
 from heaven_and_earth.calendar import CalendarRepository, GameCalendar
 from heaven_and_earth.models import (
     DAYS_PER_YEAR,
+    FOUNDATION_FILL_TICKS,
     CultivationProgress,
     Player,
+    QiQuality,
+    QiType,
     REALM_ORDER,
+    Realm,
     SECONDS_PER_TICK,
+    Stage,
     TalentSheet,
     World,
+    YEARS_PER_SECOND,
     Zone,
     slugify,
+    stage_label_for,
 )
 from heaven_and_earth.storage import PlayerRepository, WorldRepository
 
@@ -27,15 +41,31 @@ logging.basicConfig(level=logging.INFO)
 load_dotenv()
 
 
+TALENT_QUALITY_COLOURS = {
+    "Trash": "\u001b[31m",  # Red
+    "Average": "\u001b[33m",  # Yellow
+    "Genius": "\u001b[32m",  # Green
+}
+
+
 def format_talents_block(talents: TalentSheet) -> str:
+    # Talents are rolled once at registration, so the block is memoized on the five values.
+    return _format_talents_block(
+        talents.physical_strength,
+        talents.constitution,
+        talents.agility,
+        talents.spiritual_power,
+        talents.perception,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_talents_block(
+    physical_strength: float, constitution: float, agility: float, spiritual_power: float, perception: float
+) -> str:
     def format_quality(value: float) -> str:
         quality = TalentSheet.quality(value)
-        color_map = {
-            "Trash": "\u001b[31m",  # Red
-            "Average": "\u001b[33m",  # Yellow
-            "Genius": "\u001b[32m",  # Green
-        }
-        color = color_map.get(quality, "")
+        color = TALENT_QUALITY_COLOURS.get(quality, "")
         reset = "\u001b[0m" if color else ""
         return f"{color}{quality}{reset}"
 
@@ -53,32 +83,94 @@ def format_talents_block(talents: TalentSheet) -> str:
 
     return "**TALENT**\n" + "\n".join(
         [
-            format_talent_entry("Physical Strength", talents.physical_strength),
-            format_talent_entry("Constitution", talents.constitution),
-            format_talent_entry("Agility", talents.agility),
-            format_talent_entry("Spiritual Power", talents.spiritual_power),
-            format_talent_entry("Perception", talents.perception),
+            format_talent_entry("Physical Strength", physical_strength),
+            format_talent_entry("Constitution", constitution),
+            format_talent_entry("Agility", agility),
+            format_talent_entry("Spiritual Power", spiritual_power),
+            format_talent_entry("Perception", perception),
         ]
     )
 
 
+# (player name, note) pairs; formatted lazily by the logger.
+TickLog = tuple[str, str]
+
+# (newline-joined lower-cased names, start offset of each name, entries in the same order).
+SearchIndex = tuple[str, List[int], list]
+
+# Players with nothing to report are folded forward in batches of at most this many ticks.
+MAX_DEFERRED_TICKS = 60
+
+
 class WorldService:
+    """In-memory worlds and zones; mutators do not persist, callers follow up with save/save_async."""
+
     def __init__(self) -> None:
         self.repo = WorldRepository()
         self.worlds: Dict[str, World] = {}
         self.zones: Dict[str, Zone] = {}
+        self._beginning_world_id: str | None = None
+        self._beginning_zone_id: str | None = None
+        # Lower-cased display name -> id; the first world or zone with a name wins, as with the old scans.
+        self._world_name_index: Dict[str, str] = {}
+        self._zone_name_index: Dict[tuple[str, str], str] = {}
+        self._zones_by_world: Dict[str, Dict[str, Zone]] = {}
+        # Autocomplete corpora, built on first request and dropped when worlds or zones change; see _build_search_index.
+        self._world_search: Optional[SearchIndex] = None
+        self._zone_search: Dict[str, SearchIndex] = {}
+        # (world_id, zone_id) -> combined time flow; cleared whenever worlds or zones change.
+        self._flow_cache: Dict[tuple[str | None, str | None], float] = {}
+        # Serialises save_async so writes land in order and never share worlds.tmp.
+        self._save_lock = asyncio.Lock()
 
     def load(self) -> None:
         self.worlds, self.zones = self.repo.load_all()
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        self._flow_cache.clear()
+        self._beginning_world_id = None
+        self._beginning_zone_id = None
+        self._world_name_index = {}
+        self._zone_name_index = {}
+        self._zones_by_world = {}
+        self._world_search = None
+        self._zone_search = {}
+        for world in self.worlds.values():
+            self._index_world(world)
+        for zone in self.zones.values():
+            self._index_zone(zone)
+
+    def _index_world(self, world: World) -> None:
+        if world.beginning and self._beginning_world_id is None:
+            self._beginning_world_id = world.id
+        self._world_name_index.setdefault(world.name.lower(), world.id)
+        self._world_search = None
+
+    def _index_zone(self, zone: Zone) -> None:
+        if zone.beginning and self._beginning_zone_id is None:
+            self._beginning_zone_id = zone.id
+        self._zone_name_index.setdefault((zone.world_id, zone.name.lower()), zone.id)
+        self._zones_by_world.setdefault(zone.world_id, {})[zone.id] = zone
+        self._zone_search.pop(zone.world_id, None)
 
     def save(self) -> None:
         self.repo.save_all(self.worlds, self.zones)
 
+    async def save_async(self) -> None:
+        async with self._save_lock:
+            # Encode on the event loop so worlds and zones are never read off-thread; only the write is offloaded.
+            content = self.repo.encode_all(self.worlds, self.zones)
+            try:
+                await asyncio.to_thread(self.repo.write, content)
+            except OSError:
+                logging.exception("Failed to persist world data")
+
     def beginning_world(self) -> World | None:
-        return next((world for world in self.worlds.values() if world.beginning), None)
+        return self.get_world(self._beginning_world_id)
 
     def beginning_zone(self) -> Zone | None:
-        return next((zone for zone in self.zones.values() if zone.beginning), None)
+        return self.get_zone(self._beginning_zone_id)
 
     def get_world(self, world_id: str | None) -> World | None:
         if not world_id:
@@ -95,16 +187,13 @@ class WorldService:
         candidate = f"{world_id}-{slug}"
         if candidate in self.zones:
             return candidate
-        for zone_id, zone in self.zones.items():
-            if zone.world_id == world_id and zone.name.lower() == name.lower():
-                return zone_id
-        return None
+        return self._zone_name_index.get((world_id, name.lower()))
 
     def create_world(self, name: str, role_id: int, beginning: bool, time_flow: float) -> World:
         world_id = slugify(name)
         if world_id in self.worlds:
             raise ValueError("A world with that name already exists")
-        if beginning and any(world.beginning for world in self.worlds.values()):
+        if beginning and self._beginning_world_id is not None:
             raise ValueError("Only one beginning world can exist")
         world = World(
             id=world_id,
@@ -114,7 +203,8 @@ class WorldService:
             time_flow=time_flow if time_flow > 0 else 1.0,
         )
         self.worlds[world_id] = world
-        self.save()
+        self._index_world(world)
+        self._flow_cache.clear()
         return world
 
     def create_zone(
@@ -132,7 +222,7 @@ class WorldService:
             raise ValueError("World not found")
         if beginning and not self.worlds[world_id].beginning:
             raise ValueError("Beginning zones must be placed in the beginning world")
-        if beginning and any(zone.beginning for zone in self.zones.values()):
+        if beginning and self._beginning_zone_id is not None:
             raise ValueError("Only one beginning zone can exist")
         zone_id = f"{world_id}-{slugify(name)}"
         if zone_id in self.zones:
@@ -149,34 +239,87 @@ class WorldService:
             time_flow=time_flow if time_flow > 0 else 1.0,
         )
         self.zones[zone_id] = zone
-        self.save()
+        self._index_zone(zone)
+        self._flow_cache.clear()
         return zone
 
     def delete_world(self, world_id: str, player_service: Optional["PlayerService"] = None) -> tuple[World, List[Zone]]:
-        world = self.worlds.pop(world_id, None)
-        if not world:
+        if world_id not in self.worlds:
             raise ValueError("World not found")
-        removed_zones = [zone for zone in self.zones.values() if zone.world_id == world_id]
+        if player_service:
+            player_service.catch_up_world(world_id)
+        world = self.worlds.pop(world_id)
+        removed_zones = list(self._zones_by_world.get(world_id, {}).values())
         for zone in removed_zones:
             self.zones.pop(zone.id, None)
+        # Deletes are rare admin actions; rebuilding keeps first-name-wins ordering exact.
+        self._rebuild_indexes()
         if player_service:
-            player_service.handle_world_deleted(world_id, [zone.id for zone in removed_zones])
-        self.save()
+            player_service.handle_world_deleted(world_id, frozenset(zone.id for zone in removed_zones))
         return world, removed_zones
 
     def delete_zone(self, zone_id: str, player_service: Optional["PlayerService"] = None) -> Zone:
-        zone = self.zones.pop(zone_id, None)
-        if not zone:
+        if zone_id not in self.zones:
             raise ValueError("Zone not found")
+        if player_service:
+            player_service.catch_up_zone(zone_id)
+        zone = self.zones.pop(zone_id)
+        self._rebuild_indexes()
         if player_service:
             player_service.handle_zone_deleted(zone_id)
-        self.save()
         return zone
 
     def get_zones_for_world(self, world_id: str) -> List[Zone]:
         return [zone for zone in self.zones.values() if zone.world_id == world_id]
 
+    @staticmethod
+    def _build_search_index(entries: Sequence) -> SearchIndex:
+        """Pack lower-cased names into one newline-joined string plus each name's start offset."""
+        names = [entry.name.lower() for entry in entries]
+        starts: List[int] = []
+        offset = 0
+        for name in names:
+            starts.append(offset)
+            offset += len(name) + 1
+        return "\n".join(names), starts, list(entries)
+
+    @staticmethod
+    def _search_index(index: SearchIndex, text: str, limit: int) -> list:
+        blob, starts, entries = index
+        if not entries:
+            return []
+        needle = text.lower()
+        matches = []
+        position = 0
+        while len(matches) < limit:
+            found = blob.find(needle, position)
+            if found < 0:
+                break
+            slot = bisect.bisect_right(starts, found) - 1
+            matches.append(entries[slot])
+            # Resume at the next name so one entry is never reported twice.
+            position = starts[slot + 1] if slot + 1 < len(starts) else len(blob) + 1
+        return matches
+
+    def search_worlds(self, text: str, limit: int = 25) -> List[World]:
+        """Worlds whose name contains ``text`` (case-insensitive), in creation order."""
+        if self._world_search is None:
+            self._world_search = self._build_search_index(list(self.worlds.values()))
+        return self._search_index(self._world_search, text, limit)
+
+    def search_zones(self, world_id: str, text: str, limit: int = 25) -> List[Zone]:
+        """Zones of ``world_id`` whose name contains ``text`` (case-insensitive), in creation order."""
+        index = self._zone_search.get(world_id)
+        if index is None:
+            zones = list(self._zones_by_world.get(world_id, {}).values())
+            index = self._zone_search[world_id] = self._build_search_index(zones)
+        return self._search_index(index, text, limit)
+
     def effective_time_flow(self, player: Player) -> float:
+        key = (player.world_id, player.zone_id)
+        cached = self._flow_cache.get(key)
+        if cached is not None:
+            return cached
         world_flow = 1.0
         zone_flow = 1.0
         world = self.get_world(player.world_id)
@@ -185,7 +328,8 @@ class WorldService:
             world_flow = max(world.time_flow, 0.0) or 1.0
         if zone:
             zone_flow = max(zone.time_flow, 0.0) or 1.0
-        return world_flow * zone_flow
+        flow = self._flow_cache[key] = world_flow * zone_flow
+        return flow
 
     def clamp_position(self, player: Player) -> None:
         zone = self.get_zone(player.zone_id)
@@ -193,58 +337,237 @@ class WorldService:
             player.position_x = 0
             player.position_y = 0
             return
-        player.position_x = min(max(player.position_x, 0), max(zone.x_size - 1, 0))
-        player.position_y = min(max(player.position_y, 0), max(zone.y_size - 1, 0))
+        x_max = max(zone.x_size - 1, 0)
+        y_max = max(zone.y_size - 1, 0)
+        x = player.position_x
+        y = player.position_y
+        if not 0 <= x <= x_max:
+            player.position_x = 0 if x < 0 else x_max
+        if not 0 <= y <= y_max:
+            player.position_y = 0 if y < 0 else y_max
 
     def find_world_id(self, name: str) -> str | None:
         slug = slugify(name)
         if slug in self.worlds:
             return slug
-        for world_id, world in self.worlds.items():
-            if world.name.lower() == name.lower():
-                return world_id
-        return None
+        return self._world_name_index.get(name.lower())
 
 class PlayerService:
+    flush_delay: float = 0.5
+    flush_jitter: float = 0.5
+
     def __init__(self, world_service: WorldService, calendar: GameCalendar) -> None:
         self.repo = PlayerRepository()
         self.players: Dict[int, Player] = {}
         self.world_service = world_service
         self.calendar = calendar
+        self._dirty: set[int] = set()
+        self._flush_event: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        # Min-heap of (next tick deadline, user_id); entries not matching _tick_deadlines are stale.
+        self._tick_heap: List[tuple[int, int]] = []
+        self._tick_deadlines: Dict[int, int] = {}
+        # Set when a deadline lands ahead of the heap top, so a sleeping scheduler re-reads the heap.
+        self.tick_schedule_changed = asyncio.Event()
+        # Reverse indexes of user ids by current world and zone; kept in step by _set_player_location.
+        self._players_by_world: Dict[str, set[int]] = {}
+        self._players_by_zone: Dict[str, set[int]] = {}
 
     def load(self) -> None:
         self.players = self.repo.load_all()
+        now = int(time.time())
         for player in self.players.values():
             self.world_service.clamp_position(player)
-            self.update_time_flow_tracking(player)
+            self.update_time_flow_tracking(player, now)
+        self._rebuild_location_index()
+        self._rebuild_tick_schedule()
+
+    def _rebuild_location_index(self) -> None:
+        self._players_by_world = {}
+        self._players_by_zone = {}
+        for user_id, player in self.players.items():
+            if player.world_id:
+                self._players_by_world.setdefault(player.world_id, set()).add(user_id)
+            if player.zone_id:
+                self._players_by_zone.setdefault(player.zone_id, set()).add(user_id)
+
+    def _set_player_location(self, player: Player, world_id: str | None, zone_id: str | None) -> None:
+        user_id = player.user_id
+        moved = False
+        if player.world_id != world_id:
+            self._discard_from(self._players_by_world, player.world_id, user_id)
+            if world_id:
+                self._players_by_world.setdefault(world_id, set()).add(user_id)
+            player.world_id = world_id
+            moved = True
+        if player.zone_id != zone_id:
+            self._discard_from(self._players_by_zone, player.zone_id, user_id)
+            if zone_id:
+                self._players_by_zone.setdefault(zone_id, set()).add(user_id)
+            player.zone_id = zone_id
+            moved = True
+        if moved and user_id in self._tick_deadlines:
+            # The deadline was computed at the old location's time flow.
+            self._schedule_tick(player)
+
+    def _unindex_player(self, player: Player) -> None:
+        self._discard_from(self._players_by_world, player.world_id, player.user_id)
+        self._discard_from(self._players_by_zone, player.zone_id, player.user_id)
+
+    @staticmethod
+    def _discard_from(index: Dict[str, set[int]], key: str | None, user_id: int) -> None:
+        if not key:
+            return
+        members = index.get(key)
+        if members is not None:
+            members.discard(user_id)
+            if not members:
+                del index[key]
+
+    def _rebuild_tick_schedule(self) -> None:
+        self._tick_deadlines = {
+            user_id: self._next_tick_deadline(player) for user_id, player in self.players.items()
+        }
+        self._tick_heap = [(deadline, user_id) for user_id, deadline in self._tick_deadlines.items()]
+        heapq.heapify(self._tick_heap)
+
+    def _schedule_tick(self, player: Player) -> None:
+        deadline = self._tick_deadlines[player.user_id] = self._next_tick_deadline(player)
+        heap = self._tick_heap
+        if not heap or deadline < heap[0][0]:
+            self.tick_schedule_changed.set()
+        heapq.heappush(heap, (deadline, player.user_id))
+
+    @staticmethod
+    def _ticks_until_event(cultivation: CultivationProgress) -> float:
+        """In-game ticks until the next stage advance or foundation milestone."""
+        ticks = float("inf")
+        if not cultivation.is_maxed_out() and cultivation.cultivation_rate > 0:
+            ticks = max(cultivation.required_exp() - cultivation.exp, 0) / cultivation.cultivation_rate
+        if cultivation.foundation_bar_active() and cultivation.foundation_progress < 1.0:
+            ticks = min(ticks, (1.0 - cultivation.foundation_progress) * FOUNDATION_FILL_TICKS)
+        return ticks
+
+    def _next_tick_deadline(self, player: Player) -> int:
+        """Deadline of the first tick that can log something or end the player's life.
+
+        Ticks in between only add EXP, so they are folded in one batch when the deadline
+        arrives or when catch_up is called before the player is shown.
+        """
+        flow = self.world_service.effective_time_flow(player)
+        last_tick = player.last_tick_timestamp
+        game_ticks = self._ticks_until_event(player.cultivation) - player.tick_buffer
+        life_seconds = player.remaining_lifespan_years(last_tick, flow) / (flow * YEARS_PER_SECOND)
+        real_ticks = min(game_ticks / flow, life_seconds / SECONDS_PER_TICK, MAX_DEFERRED_TICKS)
+        return last_tick + max(math.ceil(real_ticks), 1) * SECONDS_PER_TICK
+
+    def next_tick_deadline(self) -> Optional[int]:
+        return self._tick_heap[0][0] if self._tick_heap else None
+
+    def mark_dirty(self, user_id: int) -> None:
+        self._dirty.add(user_id)
+        player = self.players.get(user_id)
+        if player is not None:
+            player.version += 1
+
+    def flush(self) -> None:
+        if not self._dirty:
+            return
+        self.repo.save_many(self.players, self._dirty)
+        self._dirty.clear()
 
-    def save(self) -> None:
-        self.repo.save_all(self.players)
+    def request_flush(self) -> None:
+        """Schedule a write of dirty players; bursts of requests share one flush."""
+        if self._flush_event is None:
+            self.flush()
+            return
+        self._flush_event.set()
+
+    def start_flusher(self) -> None:
+        self._flush_event = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task = asyncio.create_task(self._run_flusher())
+
+    async def stop_flusher(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        try:
+            await self.flush_async()
+        finally:
+            self._flush_event = None
+
+    async def flush_async(self) -> None:
+        if self._flush_lock is None:
+            self.flush()
+            return
+        async with self._flush_lock:
+            if not self._dirty:
+                return
+            # Encode on the event loop so player objects are never read off-thread.
+            pending = set(self._dirty)
+            content = self.repo.encode_many(self.players, pending)
+            self._dirty.clear()
+            try:
+                await asyncio.to_thread(self.repo.write, content)
+            except OSError:
+                # Keep the records dirty so the next flush retries them.
+                self._dirty |= pending
+                raise
+
+    async def _run_flusher(self) -> None:
+        while True:
+            await self._flush_event.wait()
+            await asyncio.sleep(self.flush_delay + random.random() * self.flush_jitter)
+            self._flush_event.clear()
+            try:
+                # Shielded so shutdown waits for an in-flight write to finish.
+                await asyncio.shield(self.flush_async())
+            except OSError:
+                logging.exception("Failed to persist player data")
 
     def players_in_zone(self, zone_id: str) -> List[Player]:
-        return [player for player in self.players.values() if player.zone_id == zone_id]
+        players = self.players
+        return [players[user_id] for user_id in self._players_by_zone.get(zone_id, ()) if user_id in players]
 
-    def is_registered(self, user: discord.abc.User) -> bool:
-        return user.id in self.players
+    def is_registered(self, user_id: int) -> bool:
+        return user_id in self.players
 
     def assign_beginning_location(self, player: Player) -> None:
         world = self.world_service.beginning_world()
         zone = self.world_service.beginning_zone()
         if world and zone and zone.world_id == world.id:
-            player.world_id = world.id
-            player.zone_id = zone.id
+            self._set_player_location(player, world.id, zone.id)
             player.position_x = 0
             player.position_y = 0
             self.world_service.clamp_position(player)
             self.update_time_flow_tracking(player)
 
-    def ensure_location(self, player: Player) -> None:
+    def ensure_location(self, player: Player, now: Optional[int] = None) -> None:
+        before = self._location_state(player)
         if not player.world_id or not player.zone_id:
             self.assign_beginning_location(player)
         self.world_service.clamp_position(player)
-        self.update_time_flow_tracking(player)
+        self.update_time_flow_tracking(player, now)
+        if self._location_state(player) != before:
+            self.mark_dirty(player.user_id)
 
-    def update_time_flow_tracking(self, player: Player) -> None:
+    @staticmethod
+    def _location_state(player: Player) -> tuple:
+        return (
+            player.world_id,
+            player.zone_id,
+            player.position_x,
+            player.position_y,
+            player.time_flow_entry_timestamp,
+        )
+
+    def update_time_flow_tracking(self, player: Player, now: Optional[int] = None) -> None:
         world = self.world_service.get_world(player.world_id)
         zone = self.world_service.get_zone(player.zone_id)
         if not world or not zone:
@@ -263,209 +586,324 @@ class PlayerService:
             or player.time_flow_entry_zone_id != zone.id
             or player.time_flow_entry_timestamp is None
         ):
-            player.time_flow_entry_timestamp = int(time.time())
+            player.time_flow_entry_timestamp = int(time.time()) if now is None else now
             player.time_flow_entry_world_id = world.id
             player.time_flow_entry_zone_id = zone.id
 
-    def register(self, user: discord.abc.User) -> Player:
-        if self.is_registered(user):
+    def register(self, user_id: int, display_name: str) -> Player:
+        if self.is_registered(user_id):
             raise ValueError("Player already registered")
-        player = self.repo.create_player(self.players, user.id, user.display_name)
+        player = self.repo.create_player(self.players, user_id, display_name)
         self.assign_beginning_location(player)
-        self.save()
+        self._schedule_tick(player)
+        self.mark_dirty(player.user_id)
+        self.request_flush()
         return player
 
     def attempt_breakthrough(self, player: Player) -> str:
         success, note = player.cultivation.attempt_foundation_breakthrough()
         if success:
             player.stats.tribulations_survived += 1
-        self.save()
+        self.mark_dirty(player.user_id)
+        self.request_flush()
         return note
 
-    def get_player(self, user: discord.abc.User) -> Optional[Player]:
-        return self.players.get(user.id)
+    def get_player(self, user_id: int) -> Optional[Player]:
+        return self.players.get(user_id)
 
     def handle_zone_deleted(self, zone_id: str) -> None:
         changed = False
-        for player in self.players.values():
-            if player.zone_id == zone_id:
-                player.zone_id = None
-                player.position_x = 0
-                player.position_y = 0
-                self.ensure_location(player)
-                changed = True
+        for user_id in list(self._players_by_zone.get(zone_id, ())):
+            player = self.players.get(user_id)
+            if player is None:
+                continue
+            self._set_player_location(player, player.world_id, None)
+            player.position_x = 0
+            player.position_y = 0
+            self.ensure_location(player)
+            self.mark_dirty(user_id)
+            changed = True
         if changed:
-            self.save()
+            self.request_flush()
 
-    def handle_world_deleted(self, world_id: str, removed_zone_ids: List[str]) -> None:
+    def handle_world_deleted(self, world_id: str, removed_zone_ids: AbstractSet[str]) -> None:
         changed = False
-        affected_zones = set(removed_zone_ids)
-        for player in self.players.values():
+        affected = set(self._players_by_world.get(world_id, ()))
+        for zone_id in removed_zone_ids:
+            affected.update(self._players_by_zone.get(zone_id, ()))
+        for user_id in affected:
+            player = self.players.get(user_id)
+            if player is None:
+                continue
             if player.world_id == world_id:
-                player.world_id = None
-                player.zone_id = None
-                player.position_x = 0
-                player.position_y = 0
-                self.ensure_location(player)
-                changed = True
-            elif player.zone_id in affected_zones:
-                player.zone_id = None
-                player.position_x = 0
-                player.position_y = 0
-                self.ensure_location(player)
-                changed = True
+                self._set_player_location(player, None, None)
+            else:
+                self._set_player_location(player, player.world_id, None)
+            player.position_x = 0
+            player.position_y = 0
+            self.ensure_location(player)
+            self.mark_dirty(user_id)
+            changed = True
         if changed:
-            self.save()
+            self.request_flush()
 
-    def _apply_time_progression(self, player: Player, real_ticks: int, now: int) -> tuple[List[str], bool, bool]:
-        logs: List[str] = []
-        changed = False
-        self.update_time_flow_tracking(player)
-        total_ticks = player.tick_buffer + real_ticks * self.world_service.effective_time_flow(player)
+    @staticmethod
+    def _flow_entry(player: Player) -> tuple:
+        return (
+            player.time_flow_entry_timestamp,
+            player.time_flow_entry_world_id,
+            player.time_flow_entry_zone_id,
+        )
+
+    def _apply_time_progression(
+        self, player: Player, real_ticks: int, remainder: int, now: int, logs: Optional[List[TickLog]]
+    ) -> tuple[bool, bool]:
+        """Advance ``player`` by ``real_ticks`` whole ticks; ``remainder`` seconds carry to the next tick.
+
+        Notes are appended to ``logs`` unless it is None. Returns ``(changed, perished)``.
+        """
+        entry_before = self._flow_entry(player)
+        self.update_time_flow_tracking(player, now)
+        changed = self._flow_entry(player) != entry_before
+        flow = self.world_service.effective_time_flow(player)
+        tick_buffer = player.tick_buffer
+        total_ticks = tick_buffer + real_ticks * flow
         ticks_to_apply = int(total_ticks)
+        new_buffer = total_ticks - ticks_to_apply
+        last_tick = now - remainder
         if ticks_to_apply:
-            notes = player.apply_ticks(int(ticks_to_apply))
-            logs.extend([f"{player.name}: {note}" for note in notes])
+            notes = player.apply_ticks(ticks_to_apply)
+            if logs is not None and notes:
+                name = player.name
+                logs.extend((name, note) for note in notes)
             changed = True
-        new_buffer = total_ticks - ticks_to_apply
-        if new_buffer != player.tick_buffer:
+        if new_buffer != tick_buffer:
             player.tick_buffer = new_buffer
             changed = True
-        player.last_tick_timestamp += int(real_ticks * SECONDS_PER_TICK)
-        changed = True
-        if player.last_tick_timestamp > now:
-            player.last_tick_timestamp = now
-        remaining_life = player.remaining_lifespan_years(
-            self.calendar, now, self.world_service.effective_time_flow(player)
-        )
-        return logs, changed, remaining_life <= 0
+        if last_tick != player.last_tick_timestamp:
+            player.last_tick_timestamp = last_tick
+            changed = True
+        remaining_life = player.remaining_lifespan_years(now, flow)
+        return changed, remaining_life <= 0
 
-    def apply_offline_ticks(self) -> List[str]:
-        now = int(time.time())
-        logs: List[str] = []
-        changed = False
-        players_to_remove: List[int] = []
-        for player in list(self.players.values()):
-            elapsed = max(now - player.last_tick_timestamp, 0)
-            real_ticks = elapsed // SECONDS_PER_TICK
-            if real_ticks:
-                notes, player_changed, perished = self._apply_time_progression(
-                    player, int(real_ticks), now
-                )
-                logs.extend(notes)
-                changed = changed or player_changed
-                if perished:
-                    players_to_remove.append(player.user_id)
-        for user_id in players_to_remove:
+    def _remove_perished(self, user_ids: Sequence[int], collect_logs: bool) -> List[TickLog]:
+        logs: List[TickLog] = []
+        for user_id in user_ids:
             player = self.players.pop(user_id, None)
+            self._tick_deadlines.pop(user_id, None)
             if player:
-                logs.append(f"{player.name}: Lifespan depleted; the soul dissipates.")
-                changed = True
-        if logs or changed:
-            self.save()
+                self._unindex_player(player)
+                if collect_logs:
+                    logs.append((player.name, "Lifespan depleted; the soul dissipates."))
+                self.mark_dirty(user_id)
         return logs
 
-    def apply_live_tick(self) -> List[str]:
+    def catch_up(self, player: Player, now: Optional[int] = None) -> bool:
+        """Fold any whole ticks owed to ``player`` before it is shown or moved.
+
+        Returns False when the folded time ends the player's lifespan; the player is then removed.
+        """
+        if now is None:
+            now = int(time.time())
+        real_ticks, remainder = divmod(max(now - player.last_tick_timestamp, 0), SECONDS_PER_TICK)
+        if real_ticks <= 0:
+            return True
+        collect_logs = logging.getLogger().isEnabledFor(logging.INFO)
+        logs: List[TickLog] = []
+        player_changed, perished = self._apply_time_progression(
+            player, real_ticks, remainder, now, logs if collect_logs else None
+        )
+        if player_changed:
+            self.mark_dirty(player.user_id)
+        if perished:
+            logs.extend(self._remove_perished([player.user_id], collect_logs))
+        else:
+            self._schedule_tick(player)
+        self.request_flush()
+        for name, note in logs:
+            logging.info("%s: %s", name, note)
+        return not perished
+
+    def catch_up_world(self, world_id: str, now: Optional[int] = None) -> None:
+        """Settle everyone in ``world_id`` at its current time flow before the world changes."""
+        players = self.players
+        for user_id in list(self._players_by_world.get(world_id, ())):
+            player = players.get(user_id)
+            if player is not None:
+                self.catch_up(player, now)
+
+    def catch_up_zone(self, zone_id: str, now: Optional[int] = None) -> None:
+        """Settle everyone in ``zone_id`` at its current time flow before the zone changes."""
+        players = self.players
+        for user_id in list(self._players_by_zone.get(zone_id, ())):
+            player = players.get(user_id)
+            if player is not None:
+                self.catch_up(player, now)
+
+    def apply_offline_ticks(self, collect_logs: bool = True) -> List[TickLog]:
         now = int(time.time())
-        logs: List[str] = []
-        changed = False
+        logs: List[TickLog] = []
+        sink = logs if collect_logs else None
         players_to_remove: List[int] = []
-        for player in list(self.players.values()):
-            elapsed = max(now - player.last_tick_timestamp, 0)
-            real_ticks = max(int(elapsed // SECONDS_PER_TICK), 1)
-            notes, player_changed, perished = self._apply_time_progression(player, real_ticks, now)
-            logs.extend(notes)
-            changed = changed or player_changed
+        cutoff = now - SECONDS_PER_TICK
+        stale = [player for player in self.players.values() if player.last_tick_timestamp <= cutoff]
+        for player in stale:
+            real_ticks, remainder = divmod(max(now - player.last_tick_timestamp, 0), SECONDS_PER_TICK)
+            player_changed, perished = self._apply_time_progression(
+                player, real_ticks, remainder, now, sink
+            )
+            if player_changed:
+                self.mark_dirty(player.user_id)
             if perished:
                 players_to_remove.append(player.user_id)
-        for user_id in players_to_remove:
-            player = self.players.pop(user_id, None)
-            if player:
-                logs.append(f"{player.name}: Lifespan depleted; the soul dissipates.")
-                changed = True
-        if logs or changed:
-            self.save()
-        else:
-            self.repo.save_all(self.players)
+        logs.extend(self._remove_perished(players_to_remove, collect_logs))
+        self._rebuild_tick_schedule()
+        return logs
+
+    def apply_due_ticks(self, collect_logs: bool = True) -> List[TickLog]:
+        """Tick only the players whose next tick deadline has passed.
+
+        With ``collect_logs`` false the players are still advanced but no notes are gathered.
+        """
+        now = int(time.time())
+        logs: List[TickLog] = []
+        sink = logs if collect_logs else None
+        players_to_remove: List[int] = []
+        heap = self._tick_heap
+        deadlines = self._tick_deadlines
+        while heap and heap[0][0] <= now:
+            deadline, user_id = heapq.heappop(heap)
+            player = self.players.get(user_id)
+            if player is None or deadlines.get(user_id) != deadline:
+                continue
+            real_ticks, remainder = divmod(max(now - player.last_tick_timestamp, 0), SECONDS_PER_TICK)
+            if real_ticks > 0:
+                player_changed, perished = self._apply_time_progression(
+                    player, real_ticks, remainder, now, sink
+                )
+                if player_changed:
+                    self.mark_dirty(user_id)
+                if perished:
+                    players_to_remove.append(user_id)
+                    continue
+            self._schedule_tick(player)
+        logs.extend(self._remove_perished(players_to_remove, collect_logs))
         return logs
 
 
+PROFILE_TABS = (
+    discord.SelectOption(label="Overview", value="overview", description="Age and location"),
+    discord.SelectOption(label="Stats", value="stats", description="Talents and attributes"),
+    discord.SelectOption(label="Cultivation", value="cultivation", description="Realms and tribulations"),
+    discord.SelectOption(label="Skills", value="skills", description="Talents and arts"),
+    discord.SelectOption(label="Inventory", value="inventory", description="Items carried"),
+    discord.SelectOption(label="Equipment", value="equipment", description="Currently equipped gear"),
+    discord.SelectOption(label="Statistics", value="statistics", description="Battle and cultivation logs"),
+)
+
 PROFILE_SUBTABS = {
-    "skills": [
+    "skills": (
         discord.SelectOption(label="Combat Arts", value="combat", description="Sword, spear, and fist forms"),
         discord.SelectOption(label="Support Arts", value="support", description="Alchemy, talismans, formations"),
         discord.SelectOption(label="Movement", value="movement", description="Lightfoot and cloud-riding"),
-    ],
-    "inventory": [
+    ),
+    "inventory": (
         discord.SelectOption(label="Satchel", value="satchel", description="Everyday items"),
         discord.SelectOption(label="Treasures", value="treasures", description="Rare finds and loot"),
-    ],
-    "equipment": [
+    ),
+    "equipment": (
         discord.SelectOption(label="Weapon", value="weapon", description="Blades, staves, and bows"),
         discord.SelectOption(label="Armor", value="armor", description="Robes, mail, and qi-shields"),
         discord.SelectOption(label="Artifact", value="artifact", description="Mystic tools"),
         discord.SelectOption(label="Ring", value="ring", description="Spatial or spirit rings"),
         discord.SelectOption(label="All", value="all", description="Show every slot"),
-    ],
-    "statistics": [
+    ),
+    "statistics": (
         discord.SelectOption(label="Battle", value="battle", description="Combat records"),
         discord.SelectOption(label="Longevity", value="longevity", description="Age and lifespan"),
-    ],
-    "cultivation": [
+    ),
+    "cultivation": (
         discord.SelectOption(label="Breakthroughs", value="breakthroughs", description="Realm and stage progress"),
         discord.SelectOption(label="Rate", value="rate", description="Exp gain over time"),
-    ],
+    ),
+}
+
+PROFILE_SUBTAB_VALUES: Dict[str, tuple[str, ...]] = {
+    tab: tuple(option.value for option in options) for tab, options in PROFILE_SUBTABS.items()
+}
+
+PROFILE_SUBTAB_VALUE_SETS: Dict[str, frozenset[str]] = {
+    tab: frozenset(values) for tab, values in PROFILE_SUBTAB_VALUES.items()
 }
 
 
 class MainMenuView(discord.ui.View):
-    def __init__(self, service: PlayerService, world_service: WorldService, calendar: GameCalendar):
+    def __init__(
+        self,
+        service: PlayerService,
+        world_service: WorldService,
+        calendar: GameCalendar,
+        player: Optional[Player] = None,
+    ):
         super().__init__(timeout=120)
         self.service = service
         self.world_service = world_service
         self.calendar = calendar
+        self._cached_player = player
+
+    async def on_timeout(self) -> None:
+        if self._cached_player is not None:
+            main_menu_views.remove(self._cached_player.user_id, self)
+
+    def _player_for(self, interaction: discord.Interaction) -> Optional[Player]:
+        # The cached object can outlive its registry entry (death, re-registration), so compare identity.
+        player = self.service.get_player(interaction.user.id)
+        if player is not self._cached_player:
+            self._cached_player = player
+        return player
 
     @discord.ui.button(label="Profile", style=discord.ButtonStyle.primary)
     async def profile_button(self, interaction: discord.Interaction, _: discord.ui.Button):
-        player = self.service.get_player(interaction.user)
+        player = self._player_for(interaction)
         if not player:
             await interaction.response.send_message(
                 "You are not registered yet. Use /register to join the world.", ephemeral=True
             )
             return
-        self.service.ensure_location(player)
+        now = interaction_timestamp(interaction)
+        if not self.service.catch_up(player, now):
+            self._cached_player = None
+            await interaction.response.send_message(
+                "Your lifespan has run out; the soul has dissipated.", ephemeral=True
+            )
+            return
+        self.service.ensure_location(player, now)
         avatar_url = interaction.user.display_avatar.url
         await interaction.response.send_message(
             embed=build_profile_embed(
-                player, self.calendar, "overview", None, avatar_url, self.world_service
+                player, self.calendar, "overview", None, avatar_url, self.world_service, now
             ),
-            view=ProfileView(self.service, self.world_service, self.calendar, player, avatar_url),
+            view=profile_view_for(self.service, self.world_service, self.calendar, player, avatar_url),
             ephemeral=True,
         )
 
     @discord.ui.button(label="Travel", style=discord.ButtonStyle.secondary)
     async def travel_button(self, interaction: discord.Interaction, _: discord.ui.Button):
-        player = self.service.get_player(interaction.user)
+        player = self._player_for(interaction)
         if not player:
             await interaction.response.send_message(
                 "You are not registered yet. Use /register to join the world.", ephemeral=True
             )
             return
         await send_travel_panel(interaction, player, self.service, self.world_service)
+        if not self.service.is_registered(player.user_id):
+            self._cached_player = None
 
 
 class TabSelect(discord.ui.Select):
     def __init__(self, player: Player, view: "ProfileView"):
-        options = [
-            discord.SelectOption(label="Overview", value="overview", description="Age and location"),
-            discord.SelectOption(label="Stats", value="stats", description="Talents and attributes"),
-            discord.SelectOption(label="Cultivation", value="cultivation", description="Realms and tribulations"),
-            discord.SelectOption(label="Skills", value="skills", description="Talents and arts"),
-            discord.SelectOption(label="Inventory", value="inventory", description="Items carried"),
-            discord.SelectOption(label="Equipment", value="equipment", description="Currently equipped gear"),
-            discord.SelectOption(label="Statistics", value="statistics", description="Battle and cultivation logs"),
-        ]
-        super().__init__(placeholder="Choose a profile tab", options=options)
+        # discord.py may append to the options list, so hand it a copy of the shared tuple.
+        super().__init__(placeholder="Choose a profile tab", options=list(PROFILE_TABS))
         self.player = player
         self.profile_view = view
 
@@ -481,14 +919,15 @@ class TabSelect(discord.ui.Select):
                 self.profile_view.current_subtab,
                 self.profile_view.avatar_url,
                 self.profile_view.world_service,
+                interaction_timestamp(interaction),
             ),
             view=self.profile_view,
         )
 
 
 class SubTabSelect(discord.ui.Select):
-    def __init__(self, view: "ProfileView", options: List[discord.SelectOption]):
-        super().__init__(placeholder="Refine the view", options=options)
+    def __init__(self, view: "ProfileView", options: Sequence[discord.SelectOption]):
+        super().__init__(placeholder="Refine the view", options=list(options))
         self.profile_view = view
 
     async def callback(self, interaction: discord.Interaction):
@@ -502,6 +941,7 @@ class SubTabSelect(discord.ui.Select):
                 self.profile_view.current_subtab,
                 self.profile_view.avatar_url,
                 self.profile_view.world_service,
+                interaction_timestamp(interaction),
             ),
             view=self.profile_view,
         )
@@ -524,36 +964,75 @@ class ProfileView(discord.ui.View):
         self.avatar_url = avatar_url
         self.current_tab: str = "overview"
         self.current_subtab: Optional[str] = None
+        self.subtab_select: Optional[SubTabSelect] = None
+        # Built on first visit to each tab and re-attached afterwards.
+        self._subtab_selects: Dict[str, SubTabSelect] = {}
+        self.breakthrough_button: Optional[BreakthroughButton] = None
         self.tab_select = TabSelect(player, self)
         self.add_item(self.tab_select)
         self.update_subtabs()
         self.update_breakthrough_button()
 
+    def live_player(self) -> Optional[Player]:
+        """The registry entry for this view's user, rebinding the view if it outlived its player."""
+        player = self.service.get_player(self.player.user_id)
+        if player is not None and player is not self.player:
+            self.player = player
+            self.tab_select.player = player
+        return player
+
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        return interaction.user.id == self.player.user_id
+        if interaction.user.id != self.player.user_id:
+            return False
+        player = self.live_player()
+        if player is None:
+            await interaction.response.send_message(
+                "You are not registered yet. Use /register to join the world.", ephemeral=True
+            )
+            return False
+        # Tab switches and breakthroughs read cultivation state, so settle owed ticks first.
+        if not self.service.catch_up(player, interaction_timestamp(interaction)):
+            await interaction.response.send_message(
+                "Your lifespan has run out; the soul has dissipated.", ephemeral=True
+            )
+            return False
+        return True
 
     async def on_timeout(self) -> None:
+        profile_views.remove(self.player.user_id, self)
         self.clear_items()
 
+    def reset(self, avatar_url: Optional[str]) -> None:
+        """Return a reused view to the overview tab it starts on."""
+        self.avatar_url = avatar_url
+        self.current_tab = "overview"
+        self.current_subtab = None
+        self.update_subtabs()
+        self.update_breakthrough_button()
+
     def update_subtabs(self) -> None:
-        for child in list(self.children):
-            if isinstance(child, SubTabSelect):
-                self.remove_item(child)
+        if self.subtab_select is not None:
+            self.remove_item(self.subtab_select)
+            self.subtab_select = None
         options = PROFILE_SUBTABS.get(self.current_tab)
         if options:
-            option_values = [opt.value for opt in options]
-            if self.current_subtab not in option_values:
-                self.current_subtab = option_values[0]
-            self.add_item(SubTabSelect(self, options))
+            if self.current_subtab not in PROFILE_SUBTAB_VALUE_SETS[self.current_tab]:
+                self.current_subtab = PROFILE_SUBTAB_VALUES[self.current_tab][0]
+            select = self._subtab_selects.get(self.current_tab)
+            if select is None:
+                select = self._subtab_selects[self.current_tab] = SubTabSelect(self, options)
+            self.subtab_select = select
+            self.add_item(select)
         else:
             self.current_subtab = None
 
     def update_breakthrough_button(self) -> None:
-        for child in list(self.children):
-            if isinstance(child, BreakthroughButton):
-                self.remove_item(child)
+        if self.breakthrough_button is not None:
+            self.remove_item(self.breakthrough_button)
+            self.breakthrough_button = None
         if isinstance(self.player.cultivation, CultivationProgress) and self.player.cultivation.foundation_bar_active():
-            self.add_item(BreakthroughButton(self))
+            self.breakthrough_button = BreakthroughButton(self)
+            self.add_item(self.breakthrough_button)
 
 
 class BreakthroughButton(discord.ui.Button):
@@ -567,14 +1046,15 @@ class BreakthroughButton(discord.ui.Button):
         return f"Breakthrough | {chance_percent:.0f}% chance"
 
     async def callback(self, interaction: discord.Interaction):
-        player = self.profile_view.service.get_player(interaction.user)
-        if not player:
-            await interaction.response.send_message(
-                "You are not registered yet. Use /register to join the world.", ephemeral=True
-            )
-            return
+        player = self.profile_view.player
+        if self.profile_view.service.get_player(interaction.user.id) is not player:
+            player = self.profile_view.live_player()
+            if not player:
+                await interaction.response.send_message(
+                    "You are not registered yet. Use /register to join the world.", ephemeral=True
+                )
+                return
         note = self.profile_view.service.attempt_breakthrough(player)
-        self.profile_view.player = player
         self.label = self._label_text()
         embed = build_profile_embed(
             player,
@@ -583,12 +1063,78 @@ class BreakthroughButton(discord.ui.Button):
             self.profile_view.current_subtab,
             self.profile_view.avatar_url,
             self.profile_view.world_service,
+            interaction_timestamp(interaction),
         )
         self.profile_view.update_breakthrough_button()
         await interaction.response.edit_message(embed=embed, view=self.profile_view)
         await interaction.followup.send(note, ephemeral=True)
 
 
+class UserViewCache:
+    """Most recent view per user, reused by repeated commands until shortly before it times out."""
+
+    expiry_margin = 10.0
+
+    def __init__(self) -> None:
+        self.views: Dict[int, tuple[float, discord.ui.View]] = {}
+
+    def get(self, user_id: int) -> Optional[discord.ui.View]:
+        entry = self.views.get(user_id)
+        if entry is None:
+            return None
+        created, view = entry
+        expired = view.timeout is not None and time.monotonic() - created >= view.timeout - self.expiry_margin
+        if expired or view.is_finished():
+            self.views.pop(user_id, None)
+            return None
+        return view
+
+    def store(self, user_id: int, view: discord.ui.View) -> None:
+        self.views[user_id] = (time.monotonic(), view)
+
+    def remove(self, user_id: int, view: discord.ui.View) -> None:
+        entry = self.views.get(user_id)
+        if entry is not None and entry[1] is view:
+            self.views.pop(user_id, None)
+
+
+main_menu_views = UserViewCache()
+profile_views = UserViewCache()
+
+
+def main_menu_view_for(
+    service: PlayerService, world_service: WorldService, calendar: GameCalendar, player: Player
+) -> MainMenuView:
+    view = main_menu_views.get(player.user_id)
+    if isinstance(view, MainMenuView):
+        view._cached_player = player
+        return view
+    view = MainMenuView(service, world_service, calendar, player)
+    main_menu_views.store(player.user_id, view)
+    return view
+
+
+def profile_view_for(
+    service: PlayerService,
+    world_service: WorldService,
+    calendar: GameCalendar,
+    player: Player,
+    avatar_url: Optional[str] = None,
+) -> ProfileView:
+    view = profile_views.get(player.user_id)
+    if isinstance(view, ProfileView) and view.player is player:
+        view.reset(avatar_url)
+        return view
+    view = ProfileView(service, world_service, calendar, player, avatar_url)
+    profile_views.store(player.user_id, view)
+    return view
+
+
+def interaction_timestamp(interaction: discord.Interaction) -> int:
+    """Unix time the interaction was created, shared by everything one callback renders."""
+    return int(interaction.created_at.timestamp())
+
+
 def calculate_time_flow_duration(player: Player, world_service: Optional[WorldService], now: int) -> float | None:
     if not world_service:
         return None
@@ -619,6 +1165,10 @@ def format_in_world_duration(days: float) -> str:
     return "≈ " + (" and ".join(parts) if len(parts) == 2 else parts[0])
 
 
+PROFILE_EMBED_CACHE_SIZE = 512
+_profile_embed_cache: "OrderedDict[tuple, discord.Embed]" = OrderedDict()
+
+
 def build_profile_embed(
     player: Player,
     calendar: GameCalendar,
@@ -626,15 +1176,84 @@ def build_profile_embed(
     subtab: Optional[str],
     avatar_url: Optional[str] = None,
     world_service: Optional[WorldService] = None,
+    now: Optional[int] = None,
 ) -> discord.Embed:
-    now = int(time.time())
+    """Return the profile embed, reusing a cached render while nothing visible has changed."""
+    if now is None:
+        now = int(time.time())
     effective_flow = 1.0
+    if world_service:
+        effective_flow = max(world_service.effective_time_flow(player), 0.0) or 1.0
+    # Time-dependent text changes at most once per calendar day or in-game day of the player.
+    key = (
+        player.user_id,
+        player.version,
+        tab,
+        subtab,
+        avatar_url,
+        calendar.days_since_start(now),
+        int(now * effective_flow // SECONDS_PER_TICK),
+    )
+    cached = _profile_embed_cache.get(key)
+    if cached is not None:
+        _profile_embed_cache.move_to_end(key)
+        return cached.copy()
+    embed = _render_profile_embed(player, calendar, tab, subtab, avatar_url, world_service, now, effective_flow)
+    _profile_embed_cache[key] = embed
+    if len(_profile_embed_cache) > PROFILE_EMBED_CACHE_SIZE:
+        _profile_embed_cache.popitem(last=False)
+    return embed.copy()
+
+
+ProfileTabBuilder = Callable[
+    [discord.Embed, Player, Optional[str], GameCalendar, Optional[WorldService], int, float], None
+]
+
+SKILL_NOTES = {
+    "combat": "Sword intent, spear momentum, and fist force will be tracked here.",
+    "support": "Alchemy cauldrons, talisman brushwork, and formation flags await scripting.",
+    "movement": "Cloud-riding, shadow steps, and lightning leaps belong here.",
+}
+
+REALM_LIST_TEXT = ", ".join(realm.value for realm in REALM_ORDER)
+
+
+@functools.lru_cache(maxsize=256)
+def _cultivation_identity(realm: Realm, stage: Stage, layer: int, qi_quality: QiQuality, qi_type: QiType) -> str:
+    """Realm, stage and qi lines of the cultivation tab; they change only on advancement."""
+    return (
+        f"Realm: {realm.value}\n"
+        f"Stage: {stage_label_for(realm, stage, layer)}\n"
+        f"Qi: {qi_quality.value} {qi_type.value}\n"
+    )
+
+
+def format_stat_entry(label: str, value: str) -> str:
+    bold = "\u001b[1m"
+    reset = "\u001b[0m"
+    bold_value = f"{bold}{value}{reset}"
+    return (
+        "```ansi\n"
+        f"{label}\n"
+        f"{bold_value}\n"
+        "```"
+    )
+
+
+def _build_overview_tab(
+    embed: discord.Embed,
+    player: Player,
+    subtab: Optional[str],
+    calendar: GameCalendar,
+    world_service: Optional[WorldService],
+    now: int,
+    effective_flow: float,
+) -> None:
     world_flow = 1.0
     zone_flow = 1.0
     world_name = "Unknown world"
     zone_name = "Unknown zone"
     if world_service:
-        effective_flow = max(world_service.effective_time_flow(player), 0.0) or 1.0
         world = world_service.get_world(player.world_id)
         zone = world_service.get_zone(player.zone_id)
         world_name = world.name if world else world_name
@@ -643,21 +1262,76 @@ def build_profile_embed(
             world_flow = max(world.time_flow, 0.0) or 1.0
         if zone:
             zone_flow = max(zone.time_flow, 0.0) or 1.0
-
-    day_seconds = SECONDS_PER_TICK / effective_flow if effective_flow > 0 else SECONDS_PER_TICK
     time_flow_duration_days = calculate_time_flow_duration(player, world_service, now)
-
-    embed = discord.Embed(title="**__PROFILE__**", colour=discord.Colour.yellow())
-    if avatar_url:
-        embed.set_thumbnail(url=avatar_url)
-    if day_seconds < 1:
-        day_length_text = f"{day_seconds * 1000:.0f} milliseconds"
-    else:
-        day_length_text = f"{day_seconds:.0f} seconds"
-    embed.set_footer(text=f"One in-game day passes every {day_length_text}.")
-    age_years = player.age_years(calendar, now, effective_flow)
+    age_years = player.age_years(now, effective_flow)
     lifespan_years = player.lifespan_years()
-    remaining_life = player.remaining_lifespan_years(calendar, now, effective_flow)
+    remaining_life = max(lifespan_years - age_years, 0.0)
+    embed.description = (
+        "**__DATE AND LOCATION__**\n"
+        f"{calendar.format_date(now)}\n"
+        f"Currently at {world_name} | {zone_name}\n"
+        f"Time flow: x{effective_flow:.2f} (world {world_flow}x, zone {zone_flow}x)\n"
+        + (
+            f"Time spent in current flow: {format_in_world_duration(time_flow_duration_days)}\n"
+            if time_flow_duration_days is not None
+            else ""
+        )
+        + "\n"
+        "**__AGE AND LIFESPAN__**\n"
+        f"Age: {age_years:.2f} years old\n"
+        f"Lifespan: {remaining_life:.2f} years remaining of {lifespan_years:.0f}\n"
+        f"Birthday: {calendar.format_date(player.birthday)}"
+    )
+
+
+def _build_stats_tab(
+    embed: discord.Embed,
+    player: Player,
+    subtab: Optional[str],
+    calendar: GameCalendar,
+    world_service: Optional[WorldService],
+    now: int,
+    effective_flow: float,
+) -> None:
+    talents = player.talents
+    effective_stats = player.effective_stats()
+    sub_stats = player.sub_stats(effective_stats)
+
+    talents_block = format_talents_block(talents)
+
+    stats_block = "**STATS**\n" + "\n".join(
+        [
+            format_stat_entry("Physical Strength", f"{effective_stats.physical_strength:.1f}"),
+            format_stat_entry("Constitution", f"{effective_stats.constitution:.1f}"),
+            format_stat_entry("Agility", f"{effective_stats.agility:.1f}"),
+            format_stat_entry("Spiritual Power", f"{effective_stats.spiritual_power:.1f}"),
+            format_stat_entry("Perception", f"{effective_stats.perception:.1f}"),
+        ]
+    )
+
+    sub_stats_block = "**SUB-STATS**\n" + "\n".join(
+        [
+            format_stat_entry("Health Points", f"{sub_stats.hp:.0f}"),
+            format_stat_entry("Defense", f"{sub_stats.defense:.0f}"),
+            format_stat_entry("Attack Speed", f"{sub_stats.attack_speed:.0f}"),
+            format_stat_entry("Evasion", f"{sub_stats.evasion:.0f}"),
+        ]
+    )
+
+    embed.add_field(name="\u200b", value=talents_block, inline=True)
+    embed.add_field(name="\u200b", value=stats_block, inline=True)
+    embed.add_field(name="\u200b", value=sub_stats_block, inline=True)
+
+
+def _build_cultivation_tab(
+    embed: discord.Embed,
+    player: Player,
+    subtab: Optional[str],
+    calendar: GameCalendar,
+    world_service: Optional[WorldService],
+    now: int,
+    effective_flow: float,
+) -> None:
     cultivation = player.cultivation
     bar_length = 20
     required_exp = cultivation.required_exp()
@@ -666,7 +1340,6 @@ def build_profile_embed(
     filled = int(clamped_ratio * bar_length)
     progress_percent = max(0.0, min(ratio * 100, 100.0))
     progress_bar = "▓" * filled + "░" * (bar_length - filled)
-    qi_signature = f"{cultivation.qi_quality.value} {cultivation.qi_type.value}"
     qi_rate = cultivation.qi_gathering_rate()
     foundation_ratio = max(0.0, min(getattr(cultivation, "foundation_progress", 0.0), 1.0))
     foundation_filled = int(foundation_ratio * bar_length)
@@ -679,179 +1352,199 @@ def build_profile_embed(
         if cultivation.foundation_bar_active() or foundation_ratio > 0
         else ""
     )
-
-    if tab == "overview":
-        embed.description = (
-            "**__DATE AND LOCATION__**\n"
-            f"{calendar.format_date(now)}\n"
-            f"Currently at {world_name} | {zone_name}\n"
-            f"Time flow: x{effective_flow:.2f} (world {world_flow}x, zone {zone_flow}x)\n"
-            + (
-                f"Time spent in current flow: {format_in_world_duration(time_flow_duration_days)}\n"
-                if time_flow_duration_days is not None
-                else ""
-            )
-            + "\n"
-            "**__AGE AND LIFESPAN__**\n"
-            f"Age: {age_years:.2f} years old\n"
-            f"Lifespan: {remaining_life:.2f} years remaining of {lifespan_years:.0f}\n"
-            f"Birthday: {calendar.format_date(player.birthday)}"
-        )
-    elif tab == "stats":
-        talents = player.talents
-        effective_stats = player.effective_stats()
-        sub_stats = player.sub_stats()
-
-        bold = "\u001b[1m"
-        reset = "\u001b[0m"
-
-        def format_stat_entry(label: str, value: str) -> str:
-            bold_value = f"{bold}{value}{reset}"
-            return (
-                "```ansi\n"
-                f"{label}\n"
-                f"{bold_value}\n"
-                "```"
-            )
-
-        talents_block = format_talents_block(talents)
-
-        stats_block = "**STATS**\n" + "\n".join(
-            [
-                format_stat_entry("Physical Strength", f"{effective_stats.physical_strength:.1f}"),
-                format_stat_entry("Constitution", f"{effective_stats.constitution:.1f}"),
-                format_stat_entry("Agility", f"{effective_stats.agility:.1f}"),
-                format_stat_entry("Spiritual Power", f"{effective_stats.spiritual_power:.1f}"),
-                format_stat_entry("Perception", f"{effective_stats.perception:.1f}"),
-            ]
-        )
-
-        sub_stats_block = "**SUB-STATS**\n" + "\n".join(
-            [
-                format_stat_entry("Health Points", f"{sub_stats.hp:.0f}"),
-                format_stat_entry("Defense", f"{sub_stats.defense:.0f}"),
-                format_stat_entry("Attack Speed", f"{sub_stats.attack_speed:.0f}"),
-                format_stat_entry("Evasion", f"{sub_stats.evasion:.0f}"),
-            ]
-        )
-
-        embed.add_field(name="\u200b", value=talents_block, inline=True)
-        embed.add_field(name="\u200b", value=stats_block, inline=True)
-        embed.add_field(name="\u200b", value=sub_stats_block, inline=True)
-    elif tab == "cultivation":
-        ticks_needed = cultivation.ticks_until_breakthrough()
-        embed.description = (
-            "**CULTIVATION**\n"
-            f"Realm: {cultivation.realm.value}\n"
-            f"Stage: {cultivation.stage_label()}\n"
-            f"Qi: {qi_signature}\n"
-            f"Rate: {qi_rate:.1f} qi/day\n\n"
-            f"Progress: {cultivation.exp:.0f}/{required_exp:.0f} qi\n"
-            f"{progress_bar} {progress_percent:.0f}%{foundation_block}"
-        )
-        if subtab == "breakthroughs":
-            if cultivation.foundation_bar_active():
-                embed.add_field(
-                    name="Foundation consolidation",
-                    value=(
-                        f"~{ticks_needed:.1f} days until the foundation bar is full and chance reaches 100%."
-                        if ticks_needed != float('inf')
-                        else "Foundation bar stalled."
-                    ),
-                    inline=False,
-                )
-                embed.add_field(
-                    name="Breakthrough requirement",
-                    value=(
-                        f"Manual attempt required. Current success chance: {breakthrough_percent:.0f}%."
-                    ),
-                    inline=False,
-                )
-            else:
-                embed.add_field(
-                    name="Next tribulation",
-                    value=f"{ticks_needed:.1f} days until chance to break through.",
-                    inline=False,
-                )
-                embed.add_field(name="Realms", value=", ".join(realm.value for realm in REALM_ORDER), inline=False)
-        elif subtab == "rate":
-            days = ticks_needed if ticks_needed != float("inf") else float("inf")
+    ticks_needed = cultivation.ticks_until_breakthrough()
+    identity = _cultivation_identity(
+        cultivation.realm, cultivation.stage, cultivation.layer, cultivation.qi_quality, cultivation.qi_type
+    )
+    embed.description = (
+        "**CULTIVATION**\n"
+        f"{identity}"
+        f"Rate: {qi_rate:.1f} qi/day\n\n"
+        f"Progress: {cultivation.exp:.0f}/{required_exp:.0f} qi\n"
+        f"{progress_bar} {progress_percent:.0f}%{foundation_block}"
+    )
+    if subtab == "breakthroughs":
+        if cultivation.foundation_bar_active():
             embed.add_field(
-                name="Time until stage up",
+                name="Foundation consolidation",
                 value=(
-                    f"~{days:.0f} days at current rate."
-                    if days != float("inf")
-                    else "Blocked; increase cultivation rate."
+                    f"~{ticks_needed:.1f} days until the foundation bar is full and chance reaches 100%."
+                    if ticks_needed != float('inf')
+                    else "Foundation bar stalled."
                 ),
                 inline=False,
             )
-            embed.add_field(name="Tribulations survived", value=str(player.stats.tribulations_survived), inline=False)
-    elif tab == "skills":
-        sub = subtab or "combat"
-        skill_notes = {
-            "combat": "Sword intent, spear momentum, and fist force will be tracked here.",
-            "support": "Alchemy cauldrons, talisman brushwork, and formation flags await scripting.",
-            "movement": "Cloud-riding, shadow steps, and lightning leaps belong here.",
-        }
-        embed.description = skill_notes.get(sub, skill_notes["combat"])
-    elif tab == "inventory":
-        header = "Treasures" if subtab == "treasures" else "Satchel"
-        if player.inventory:
-            embed.add_field(name=header, value="\n".join(f"• {item}" for item in player.inventory), inline=False)
-        else:
-            embed.add_field(name=header, value="Your pouch is empty.", inline=False)
-    elif tab == "equipment":
-        slots = player.equipment.items() if subtab in (None, "all") else [(subtab, player.equipment.get(subtab))]
-        for key, slot in slots:
-            if slot is None:
-                continue
-            item_name = slot.get("item") if isinstance(slot, dict) else getattr(slot, "item", None)
-            desc = slot.get("description") if isinstance(slot, dict) else getattr(slot, "description", "")
             embed.add_field(
-                name=slot.get("name", key.title()) if isinstance(slot, dict) else getattr(slot, "name"),
-                value=item_name or desc or "Empty",
+                name="Breakthrough requirement",
+                value=(
+                    f"Manual attempt required. Current success chance: {breakthrough_percent:.0f}%."
+                ),
                 inline=False,
             )
-    elif tab == "statistics":
-        stats = player.stats
-        if subtab == "battle":
-            embed.add_field(name="Enemies defeated", value=str(stats.enemies_defeated), inline=True)
-            embed.add_field(name="Tribulations survived", value=str(stats.tribulations_survived), inline=True)
         else:
-            embed.add_field(name="Hours cultivating", value=f"{stats.hours_cultivated:.2f}", inline=True)
             embed.add_field(
-                name="Lifespan remaining",
-                value=f"{remaining_life:.2f}/{lifespan_years:.0f} years",
-                inline=True,
+                name="Next tribulation",
+                value=f"{ticks_needed:.1f} days until chance to break through.",
+                inline=False,
             )
+            embed.add_field(name="Realms", value=REALM_LIST_TEXT, inline=False)
+    elif subtab == "rate":
+        days = ticks_needed if ticks_needed != float("inf") else float("inf")
+        embed.add_field(
+            name="Time until stage up",
+            value=(
+                f"~{days:.0f} days at current rate."
+                if days != float("inf")
+                else "Blocked; increase cultivation rate."
+            ),
+            inline=False,
+        )
+        embed.add_field(name="Tribulations survived", value=str(player.stats.tribulations_survived), inline=False)
+
+
+def _build_skills_tab(
+    embed: discord.Embed,
+    player: Player,
+    subtab: Optional[str],
+    calendar: GameCalendar,
+    world_service: Optional[WorldService],
+    now: int,
+    effective_flow: float,
+) -> None:
+    embed.description = SKILL_NOTES.get(subtab or "combat", SKILL_NOTES["combat"])
+
+
+def _build_inventory_tab(
+    embed: discord.Embed,
+    player: Player,
+    subtab: Optional[str],
+    calendar: GameCalendar,
+    world_service: Optional[WorldService],
+    now: int,
+    effective_flow: float,
+) -> None:
+    header = "Treasures" if subtab == "treasures" else "Satchel"
+    if player.inventory:
+        embed.add_field(name=header, value=player.rendered_inventory, inline=False)
+    else:
+        embed.add_field(name=header, value="Your pouch is empty.", inline=False)
+
+
+def _build_equipment_tab(
+    embed: discord.Embed,
+    player: Player,
+    subtab: Optional[str],
+    calendar: GameCalendar,
+    world_service: Optional[WorldService],
+    now: int,
+    effective_flow: float,
+) -> None:
+    slots = player.equipment.items() if subtab in (None, "all") else [(subtab, player.equipment.get(subtab))]
+    for key, slot in slots:
+        if slot is None:
+            continue
+        embed.add_field(
+            name=slot.get("name", key.title()),
+            value=slot.get("item") or slot.get("description") or "Empty",
+            inline=False,
+        )
+
+
+def _build_statistics_tab(
+    embed: discord.Embed,
+    player: Player,
+    subtab: Optional[str],
+    calendar: GameCalendar,
+    world_service: Optional[WorldService],
+    now: int,
+    effective_flow: float,
+) -> None:
+    stats = player.stats
+    if subtab == "battle":
+        embed.add_field(name="Enemies defeated", value=str(stats.enemies_defeated), inline=True)
+        embed.add_field(name="Tribulations survived", value=str(stats.tribulations_survived), inline=True)
+    else:
+        lifespan_years = player.lifespan_years()
+        remaining_life = player.remaining_lifespan_years(now, effective_flow)
+        embed.add_field(name="Hours cultivating", value=f"{stats.hours_cultivated:.2f}", inline=True)
+        embed.add_field(
+            name="Lifespan remaining",
+            value=f"{remaining_life:.2f}/{lifespan_years:.0f} years",
+            inline=True,
+        )
+
+
+PROFILE_TAB_BUILDERS: Dict[str, ProfileTabBuilder] = {
+    "overview": _build_overview_tab,
+    "stats": _build_stats_tab,
+    "cultivation": _build_cultivation_tab,
+    "skills": _build_skills_tab,
+    "inventory": _build_inventory_tab,
+    "equipment": _build_equipment_tab,
+    "statistics": _build_statistics_tab,
+}
+
+
+def _render_profile_embed(
+    player: Player,
+    calendar: GameCalendar,
+    tab: str,
+    subtab: Optional[str],
+    avatar_url: Optional[str],
+    world_service: Optional[WorldService],
+    now: int,
+    effective_flow: float,
+) -> discord.Embed:
+    day_seconds = SECONDS_PER_TICK / effective_flow if effective_flow > 0 else SECONDS_PER_TICK
+
+    embed = discord.Embed(title="**__PROFILE__**", colour=discord.Colour.yellow())
+    if avatar_url:
+        embed.set_thumbnail(url=avatar_url)
+    if day_seconds < 1:
+        day_length_text = f"{day_seconds * 1000:.0f} milliseconds"
+    else:
+        day_length_text = f"{day_seconds:.0f} seconds"
+    embed.set_footer(text=f"One in-game day passes every {day_length_text}.")
+    builder = PROFILE_TAB_BUILDERS.get(tab)
+    if builder is not None:
+        builder(embed, player, subtab, calendar, world_service, now, effective_flow)
     return embed
 
 
+MINIMAP_EMPTY_CELL = "▫️"
+_minimap_empty_rows: Dict[int, str] = {}
+
+
 def render_minimap(player: Player, zone: Zone, players_in_zone: Optional[List[Player]] = None) -> str:
     width = min(zone.x_size, 15)
     height = min(zone.y_size, 16)
     start_x = max(0, min(player.position_x - width // 2, max(zone.x_size - width, 0)))
     start_y = max(0, min(player.position_y - height // 2, max(zone.y_size - height, 0)))
-    grid: List[str] = []
-    for y in range(height):
-        row = []
-        for x in range(width):
-            global_x = start_x + x
-            global_y = start_y + y
-            if (global_x, global_y) == (player.position_x, player.position_y):
-                row.append("🧭")
-                continue
-            other_players_here = []
-            for other in players_in_zone or []:
-                if (other.position_x, other.position_y) == (global_x, global_y) and other.user_id != player.user_id:
-                    other_players_here.append(other)
-            if len(other_players_here) == 1:
-                row.append("🧍")
-            elif len(other_players_here) > 1:
-                row.append("👥")
-            else:
-                row.append("▫️")
-        grid.append("".join(row))
+    empty_row = _minimap_empty_rows.get(width)
+    if empty_row is None:
+        empty_row = _minimap_empty_rows[width] = MINIMAP_EMPTY_CELL * width
+    # Only rows holding a marker are built cell by cell; every other row is the shared empty string.
+    occupied: Dict[int, Dict[int, int]] = {}
+    for other in players_in_zone or ():
+        if other.user_id == player.user_id:
+            continue
+        x = other.position_x - start_x
+        y = other.position_y - start_y
+        if 0 <= x < width and 0 <= y < height:
+            row_counts = occupied.setdefault(y, {})
+            row_counts[x] = row_counts.get(x, 0) + 1
+    own_x = player.position_x - start_x
+    own_y = player.position_y - start_y
+    if 0 <= own_x < width and 0 <= own_y < height:
+        occupied.setdefault(own_y, {})
+    grid = [empty_row] * height
+    for y, row_counts in occupied.items():
+        cells = [MINIMAP_EMPTY_CELL] * width
+        for x, count in row_counts.items():
+            cells[x] = "🧍" if count == 1 else "👥"
+        if y == own_y and 0 <= own_x < width:
+            cells[own_x] = "🧭"
+        grid[y] = "".join(cells)
     return "\n".join(grid)
 
 
@@ -861,8 +1554,10 @@ def build_travel_embed(
     zone: Zone,
     world_service: WorldService,
     players_in_zone: Optional[List[Player]] = None,
+    now: Optional[int] = None,
 ) -> discord.Embed:
-    now = int(time.time())
+    if now is None:
+        now = int(time.time())
     time_flow_duration_days = calculate_time_flow_duration(player, world_service, now)
     embed = discord.Embed(title="Travel", colour=discord.Colour.green())
     embed.add_field(name="World", value=world.name, inline=True)
@@ -941,7 +1636,22 @@ class TravelView(discord.ui.View):
         self.message: Optional[discord.Message] = None
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        return interaction.user.id == self.player.user_id
+        if interaction.user.id != self.player.user_id:
+            return False
+        player = self.service.get_player(self.player.user_id)
+        if player is None:
+            await interaction.response.send_message(
+                "You are not registered yet. Use /register to begin cultivating.", ephemeral=True
+            )
+            return False
+        # Moves go to the registry entry even if this panel outlived the object it was opened with.
+        self.player = player
+        if not self.service.catch_up(player, interaction_timestamp(interaction)):
+            await interaction.response.send_message(
+                "Your lifespan has run out; the soul has dissipated.", ephemeral=True
+            )
+            return False
+        return True
 
     async def on_timeout(self) -> None:
         self.session_manager.remove(self)
@@ -965,10 +1675,14 @@ class TravelView(discord.ui.View):
         self.player.position_y += dy
         self.world_service.clamp_position(self.player)
         self.player.stats.steps_travelled += abs(dx) + abs(dy)
-        self.service.save()
+        self.service.mark_dirty(self.player.user_id)
+        self.service.request_flush()
         players_in_zone = self.service.players_in_zone(zone.id)
         await interaction.response.edit_message(
-            embed=build_travel_embed(self.player, world, zone, self.world_service, players_in_zone), view=self
+            embed=build_travel_embed(
+                self.player, world, zone, self.world_service, players_in_zone, interaction_timestamp(interaction)
+            ),
+            view=self,
         )
         await self.session_manager.refresh_zone(
             zone.id, self.service, self.world_service, exclude_message_id=self.message.id if self.message else None
@@ -995,7 +1709,14 @@ class TravelView(discord.ui.View):
 async def send_travel_panel(
     interaction: discord.Interaction, player: Player, service: PlayerService, world_service: WorldService
 ) -> None:
-    service.ensure_location(player)
+    now = interaction_timestamp(interaction)
+    # Owed ticks belong to the current zone's flow, so settle them before any move.
+    if not service.catch_up(player, now):
+        await interaction.response.send_message(
+            "Your lifespan has run out; the soul has dissipated.", ephemeral=True
+        )
+        return
+    service.ensure_location(player, now)
     world = world_service.get_world(player.world_id)
     zone = world_service.get_zone(player.zone_id)
     if not world or not zone:
@@ -1003,24 +1724,21 @@ async def send_travel_panel(
             "No valid location available. Create a beginning world and zone first.", ephemeral=True
         )
         return
-    if interaction.channel_id != zone.channel_id:
-        channel_hint = None
-        if interaction.guild:
-            channel = interaction.guild.get_channel(zone.channel_id)
-            if channel:
-                channel_hint = channel.mention
+    channel_id = zone.channel_id
+    if interaction.channel_id != channel_id:
+        channel = interaction.guild.get_channel(channel_id) if interaction.guild else None
+        hint = f" ({channel.mention})" if channel else ""
         await interaction.response.send_message(
-            (
-                f"Travel can only be used in your current zone channel{f' ({channel_hint})' if channel_hint else ''}."
-            ),
+            f"Travel can only be used in your current zone channel{hint}.",
             ephemeral=True,
         )
         return
     world_service.clamp_position(player)
-    service.save()
+    service.mark_dirty(player.user_id)
+    service.request_flush()
     view = TravelView(service, world_service, player, travel_sessions)
     await interaction.response.send_message(
-        embed=build_travel_embed(player, world, zone, world_service, service.players_in_zone(zone.id)),
+        embed=build_travel_embed(player, world, zone, world_service, service.players_in_zone(zone.id), now),
         view=view,
         ephemeral=True,
     )
@@ -1029,6 +1747,9 @@ async def send_travel_panel(
 
 
 class HeavenAndEarthBot(commands.Bot):
+    # Tick progress is written at most this often unless something else requests a flush.
+    tick_flush_interval: float = 5 * SECONDS_PER_TICK
+
     def __init__(self, *, sync_guild_id: Optional[int] = None, **kwargs):
         intents = discord.Intents.default()
         intents.message_content = True
@@ -1038,14 +1759,18 @@ class HeavenAndEarthBot(commands.Bot):
         self.worlds = WorldService()
         self.service = PlayerService(self.worlds, self.calendar)
         self.sync_guild_id = sync_guild_id
+        self._tick_task: Optional[asyncio.Task] = None
 
     async def setup_hook(self) -> None:
         self.worlds.load()
         self.service.load()
-        offline_logs = self.service.apply_offline_ticks()
-        for note in offline_logs:
-            logging.info("%s", note)
-        self.tick_loop.start()
+        log_ticks = logging.getLogger().isEnabledFor(logging.INFO)
+        offline_logs = self.service.apply_offline_ticks(collect_logs=log_ticks)
+        self.service.start_flusher()
+        await self.service.flush_async()
+        for name, note in offline_logs:
+            logging.info("%s: %s", name, note)
+        self._tick_task = asyncio.create_task(self.run_tick_scheduler())
         if self.sync_guild_id:
             guild = discord.Object(id=self.sync_guild_id)
             self.tree.copy_global_to(guild=guild)
@@ -1055,19 +1780,47 @@ class HeavenAndEarthBot(commands.Bot):
             synced = await self.tree.sync()
             logging.info("Synced %s global commands", len(synced))
 
+    async def close(self) -> None:
+        if self._tick_task is not None:
+            self._tick_task.cancel()
+        try:
+            await self.service.stop_flusher()
+        except OSError:
+            logging.exception("Failed to persist player data on shutdown")
+        finally:
+            await super().close()
+
     async def on_ready(self):
         logging.info("Logged in as %s", self.user)
 
-    @tasks.loop(seconds=60)
-    async def tick_loop(self):
-        logs = self.service.apply_live_tick()
-        if logs:
-            for note in logs:
-                logging.info(note)
-
-    @tick_loop.before_loop
-    async def before_tick_loop(self):
+    async def run_tick_scheduler(self) -> None:
+        """Sleep until the earliest player tick is due, then tick every due player."""
         await self.wait_until_ready()
+        last_flush = time.monotonic()
+        rescheduled = self.service.tick_schedule_changed
+        while not self.is_closed():
+            rescheduled.clear()
+            deadline = self.service.next_tick_deadline()
+            # Nobody registered yet waits on the event alone; registering schedules the first tick.
+            timeout = None if deadline is None else max(deadline - time.time(), 1.0)
+            try:
+                await asyncio.wait_for(rescheduled.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                # An earlier deadline was scheduled while sleeping; re-read the heap.
+                continue
+            try:
+                logs = self.service.apply_due_ticks(collect_logs=logging.getLogger().isEnabledFor(logging.INFO))
+            except Exception:
+                logging.exception("Tick scheduler failed; retrying on the next deadline")
+                continue
+            # Tick-only changes are batched; interactions and shutdown still flush every dirty player.
+            if time.monotonic() - last_flush >= self.tick_flush_interval:
+                self.service.request_flush()
+                last_flush = time.monotonic()
+            for name, note in logs:
+                logging.info("%s: %s", name, note)
 
 
 sync_guild_id: Optional[int] = None
@@ -1081,36 +1834,46 @@ if sync_guild_env:
 bot = HeavenAndEarthBot(sync_guild_id=sync_guild_id)
 
 
+# Never mutated after creation, so every /main response can send the same instance.
+MAIN_MENU_EMBED = discord.Embed(title="Heaven & Earth", description="Choose your path.")
+
+
 @bot.tree.command(name="main", description="Open the main menu for Heaven and Earth")
 async def main_menu(interaction: discord.Interaction):
-    player = bot.service.get_player(interaction.user)
+    player = bot.service.get_player(interaction.user.id)
     if not player:
         await interaction.response.send_message(
             "You are not registered yet. Use /register to begin cultivating.", ephemeral=True
         )
         return
     await interaction.response.send_message(
-        embed=discord.Embed(title="Heaven & Earth", description="Choose your path."),
-        view=MainMenuView(bot.service, bot.worlds, bot.calendar),
+        embed=MAIN_MENU_EMBED,
+        view=main_menu_view_for(bot.service, bot.worlds, bot.calendar, player),
         ephemeral=True,
     )
 
 
 @bot.tree.command(name="profile", description="Show your cultivation profile")
 async def profile(interaction: discord.Interaction):
-    player = bot.service.get_player(interaction.user)
+    player = bot.service.get_player(interaction.user.id)
     if not player:
         await interaction.response.send_message(
             "You are not registered yet. Use /register to see your profile.", ephemeral=True
         )
         return
-    bot.service.ensure_location(player)
+    now = interaction_timestamp(interaction)
+    if not bot.service.catch_up(player, now):
+        await interaction.response.send_message(
+            "Your lifespan has run out; the soul has dissipated.", ephemeral=True
+        )
+        return
+    bot.service.ensure_location(player, now)
     avatar_url = interaction.user.display_avatar.url
     await interaction.response.send_message(
         embed=build_profile_embed(
-            player, bot.calendar, "overview", None, avatar_url, bot.worlds
+            player, bot.calendar, "overview", None, avatar_url, bot.worlds, now
         ),
-        view=ProfileView(bot.service, bot.worlds, bot.calendar, player, avatar_url),
+        view=profile_view_for(bot.service, bot.worlds, bot.calendar, player, avatar_url),
         ephemeral=True,
     )
 
@@ -1127,12 +1890,15 @@ async def create_world(
     beginning_world: bool,
     time_flow: Optional[float] = 1.0,
 ):
+    # World edits rewrite the TOML store; acknowledge first so a slow write cannot expire the interaction.
+    await interaction.response.defer(ephemeral=True, thinking=True)
     try:
         world = bot.worlds.create_world(name, current_location_role.id, beginning_world, time_flow or 1.0)
     except ValueError as exc:
-        await interaction.response.send_message(str(exc), ephemeral=True)
+        await interaction.followup.send(str(exc), ephemeral=True)
         return
-    await interaction.response.send_message(
+    await bot.worlds.save_async()
+    await interaction.followup.send(
         f"World **{world.name}** created with role <@&{world.current_location_role_id}>. Time flow: x{world.time_flow}.",
         ephemeral=True,
     )
@@ -1165,9 +1931,10 @@ async def create_zone(
     beginning_zone: bool,
     time_flow: Optional[float] = 1.0,
 ):
+    await interaction.response.defer(ephemeral=True, thinking=True)
     world_id = bot.worlds.find_world_id(world_name)
     if not world_id:
-        await interaction.response.send_message("World not found.", ephemeral=True)
+        await interaction.followup.send("World not found.", ephemeral=True)
         return
     try:
         zone = bot.worlds.create_zone(
@@ -1181,9 +1948,10 @@ async def create_zone(
             time_flow or 1.0,
         )
     except ValueError as exc:
-        await interaction.response.send_message(str(exc), ephemeral=True)
+        await interaction.followup.send(str(exc), ephemeral=True)
         return
-    await interaction.response.send_message(
+    await bot.worlds.save_async()
+    await interaction.followup.send(
         (
             f"Zone **{zone.name}** created in **{bot.worlds.worlds[world_id].name}**. "
             f"Role: <@&{zone.current_location_role_id}> Channel: {channel.mention}. "
@@ -1195,11 +1963,7 @@ async def create_zone(
 
 @create_zone.autocomplete("world_name")
 async def world_choice_autocomplete(interaction: discord.Interaction, current: str):
-    matches = []
-    for world in bot.worlds.worlds.values():
-        if current.lower() in world.name.lower():
-            matches.append(app_commands.Choice(name=world.name, value=world.name))
-    return matches[:25]
+    return [app_commands.Choice(name=world.name, value=world.name) for world in bot.worlds.search_worlds(current)]
 
 
 @create_zone.autocomplete("name")
@@ -1213,17 +1977,19 @@ async def zone_name_autocomplete(_: discord.Interaction, current: str):
     description="Delete a world and its zones",
 )
 async def delete_world(interaction: discord.Interaction, world_name: str):
+    await interaction.response.defer(ephemeral=True, thinking=True)
     world_id = bot.worlds.find_world_id(world_name)
     if not world_id:
-        await interaction.response.send_message("World not found.", ephemeral=True)
+        await interaction.followup.send("World not found.", ephemeral=True)
         return
     try:
         world, removed_zones = bot.worlds.delete_world(world_id, bot.service)
     except ValueError as exc:
-        await interaction.response.send_message(str(exc), ephemeral=True)
+        await interaction.followup.send(str(exc), ephemeral=True)
         return
+    await bot.worlds.save_async()
     zone_list = ", ".join(zone.name for zone in removed_zones) if removed_zones else "None"
-    await interaction.response.send_message(
+    await interaction.followup.send(
         f"World **{world.name}** deleted. Removed zones: {zone_list}.",
         ephemeral=True,
     )
@@ -1231,11 +1997,7 @@ async def delete_world(interaction: discord.Interaction, world_name: str):
 
 @delete_world.autocomplete("world_name")
 async def delete_world_autocomplete(interaction: discord.Interaction, current: str):
-    matches = []
-    for world in bot.worlds.worlds.values():
-        if current.lower() in world.name.lower():
-            matches.append(app_commands.Choice(name=world.name, value=world.name))
-    return matches[:25]
+    return [app_commands.Choice(name=world.name, value=world.name) for world in bot.worlds.search_worlds(current)]
 
 
 @app_commands.checks.has_permissions(manage_guild=True)
@@ -1244,22 +2006,24 @@ async def delete_world_autocomplete(interaction: discord.Interaction, current: s
     description="Delete a zone from a world",
 )
 async def delete_zone(interaction: discord.Interaction, world_name: str, zone_name: str):
+    await interaction.response.defer(ephemeral=True, thinking=True)
     world_id = bot.worlds.find_world_id(world_name)
     if not world_id:
-        await interaction.response.send_message("World not found.", ephemeral=True)
+        await interaction.followup.send("World not found.", ephemeral=True)
         return
     zone_id = bot.worlds.find_zone_id(world_id, zone_name)
     if not zone_id:
-        await interaction.response.send_message("Zone not found in that world.", ephemeral=True)
+        await interaction.followup.send("Zone not found in that world.", ephemeral=True)
         return
     try:
         zone = bot.worlds.delete_zone(zone_id, bot.service)
     except ValueError as exc:
-        await interaction.response.send_message(str(exc), ephemeral=True)
+        await interaction.followup.send(str(exc), ephemeral=True)
         return
+    await bot.worlds.save_async()
     world = bot.worlds.worlds.get(world_id)
     world_display = world.name if world else world_name
-    await interaction.response.send_message(
+    await interaction.followup.send(
         f"Zone **{zone.name}** removed from **{world_display}**.",
         ephemeral=True,
     )
@@ -1267,11 +2031,7 @@ async def delete_zone(interaction: discord.Interaction, world_name: str, zone_na
 
 @delete_zone.autocomplete("world_name")
 async def delete_zone_world_autocomplete(interaction: discord.Interaction, current: str):
-    matches = []
-    for world in bot.worlds.worlds.values():
-        if current.lower() in world.name.lower():
-            matches.append(app_commands.Choice(name=world.name, value=world.name))
-    return matches[:25]
+    return [app_commands.Choice(name=world.name, value=world.name) for world in bot.worlds.search_worlds(current)]
 
 
 @delete_zone.autocomplete("zone_name")
@@ -1280,16 +2040,14 @@ async def delete_zone_autocomplete(interaction: discord.Interaction, current: st
     world_id = bot.worlds.find_world_id(world_name)
     if not world_id:
         return []
-    matches = []
-    for zone in bot.worlds.zones.values():
-        if zone.world_id == world_id and current.lower() in zone.name.lower():
-            matches.append(app_commands.Choice(name=zone.name, value=zone.name))
-    return matches[:25]
+    return [
+        app_commands.Choice(name=zone.name, value=zone.name) for zone in bot.worlds.search_zones(world_id, current)
+    ]
 
 
 @bot.tree.command(name="travel", description="Open the travel minimap")
 async def travel(interaction: discord.Interaction):
-    player = bot.service.get_player(interaction.user)
+    player = bot.service.get_player(interaction.user.id)
     if not player:
         await interaction.response.send_message(
             "You are not registered yet. Use /register to begin cultivating.", ephemeral=True
@@ -1300,12 +2058,12 @@ async def travel(interaction: discord.Interaction):
 
 @bot.tree.command(name="register", description="Register as a cultivator and begin tracking your journey")
 async def register(interaction: discord.Interaction):
-    if bot.service.is_registered(interaction.user):
+    if bot.service.is_registered(interaction.user.id):
         await interaction.response.send_message(
             "You are already registered. Use /main to open your menu.", ephemeral=True
         )
         return
-    player = bot.service.register(interaction.user)
+    player = bot.service.register(interaction.user.id, interaction.user.display_name)
     avatar_url = interaction.user.display_avatar.url
     talent_block = format_talents_block(player.talents)
 
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 """Persistent in-game calendar anchored to February 2nd, 993."""
 
+import functools
+import os
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -15,17 +17,33 @@ if sys.version_info >= (3, 11):  # pragma: no cover - stdlib availability
 else:  # pragma: no cover
     import tomli as tomllib  # type: ignore[assignment]
 
-import tomli_w
-
 
 CALENDAR_START_DATE = date(993, 2, 2)
+MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
 
 
 @dataclass
 class GameCalendar:
     start_timestamp: int
+    # One-entry memo: renders within the same in-game day ask for the same date.
+    _last_days: int = field(default=-1, init=False, repr=False, compare=False)
+    _last_date: date = field(default=CALENDAR_START_DATE, init=False, repr=False, compare=False)
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def _ordinal(day: int) -> str:
         if 10 <= day % 100 <= 20:
             suffix = "th"
@@ -37,14 +55,19 @@ class GameCalendar:
         return int((timestamp - self.start_timestamp) // SECONDS_PER_TICK)
 
     def date_for_timestamp(self, timestamp: int) -> date:
-        return CALENDAR_START_DATE + timedelta(days=self.days_since_start(timestamp))
+        days = self.days_since_start(timestamp)
+        if days != self._last_days:
+            self._last_date = CALENDAR_START_DATE + timedelta(days=days)
+            self._last_days = days
+        return self._last_date
 
     def format_date(self, timestamp: int) -> str:
         current_date = self.date_for_timestamp(timestamp)
-        return f"{current_date.strftime('%B')} {self._ordinal(current_date.day)}, {current_date.year}"
+        return f"{MONTH_NAMES[current_date.month - 1]} {self._ordinal(current_date.day)}, {current_date.year}"
 
     def days_elapsed(self, start_timestamp: int, end_timestamp: int | None = None) -> float:
-        end_timestamp = end_timestamp or int(time.time())
+        if end_timestamp is None:
+            end_timestamp = int(time.time())
         return max(end_timestamp - start_timestamp, 0) / SECONDS_PER_TICK
 
 
@@ -52,20 +75,30 @@ class CalendarRepository:
     def __init__(self, data_dir: str = ".data") -> None:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.path = self.data_dir / "calendar.toml"
+        self.path = self.data_dir / "calendar.ts"
+        # Older installs stored the anchor as TOML; it is read once and migrated.
+        self.legacy_path = self.data_dir / "calendar.toml"
 
     def load_or_create_start(self) -> int:
         if self.path.exists():
-            content = self.path.read_text(encoding="utf-8")
+            content = self.path.read_text(encoding="utf-8").strip()
+            if content:
+                return int(content)
+        if self.legacy_path.exists():
+            content = self.legacy_path.read_text(encoding="utf-8")
             raw = tomllib.loads(content) if content.strip() else {}
             if "start_timestamp" in raw:
-                return int(raw["start_timestamp"])
+                start_timestamp = int(raw["start_timestamp"])
+                self.save_start(start_timestamp)
+                return start_timestamp
         start_timestamp = int(time.time())
         self.save_start(start_timestamp)
         return start_timestamp
 
     def save_start(self, start_timestamp: int) -> None:
-        payload = {"start_timestamp": int(start_timestamp)}
         tmp_path = self.path.with_suffix(".tmp")
-        tmp_path.write_text(tomli_w.dumps(payload), encoding="utf-8")
-        tmp_path.replace(self.path)
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(str(int(start_timestamp)))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, self.path)
@@ -1,16 +1,14 @@
 from __future__ import annotations
 
-import dataclasses
+import functools
 import time
 from dataclasses import dataclass, field
 from random import random, uniform
 from enum import Enum
-from typing import TYPE_CHECKING, ClassVar, Dict, List
+from types import MappingProxyType
+from typing import ClassVar, Dict, List, Mapping, Tuple
 import re
 
-if TYPE_CHECKING:  # pragma: no cover - imported only for type hints
-    from .calendar import GameCalendar
-
 
 class Realm(str, Enum):
     QI_CONDENSATION = "Qi Condensation"
@@ -25,22 +23,36 @@ class Stage(str, Enum):
     PEAK = "Peak"
 
 
-STAGE_ORDER: List[Stage] = [
+STAGE_ORDER: Tuple[Stage, ...] = (
     Stage.INITIAL,
     Stage.EARLY,
     Stage.MIDDLE,
     Stage.LATE,
     Stage.PEAK,
-]
+)
+
 
+REALM_ORDER: Tuple[Realm, ...] = (Realm.QI_CONDENSATION, Realm.FOUNDATION_ESTABLISHMENT)
 
-REALM_ORDER: List[Realm] = [Realm.QI_CONDENSATION, Realm.FOUNDATION_ESTABLISHMENT]
+# Position lookups for the orders above, so advancement never scans the lists.
+STAGE_INDEX: Dict[Stage, int] = {stage: index for index, stage in enumerate(STAGE_ORDER)}
+REALM_INDEX: Dict[Realm, int] = {realm: index for index, realm in enumerate(REALM_ORDER)}
+STAGE_COUNT = len(STAGE_ORDER)
+REALM_COUNT = len(REALM_ORDER)
+FINAL_REALM = REALM_ORDER[-1]
+
+# Qi needed per layer for each realm and stage: (realm ordinal + 1) * 100 * (stage ordinal + 1).
+REQUIRED_EXP_BASE: Dict[Realm, Dict[Stage, int]] = {
+    realm: {stage: (realm_index + 1) * 100 * (stage_index + 1) for stage_index, stage in enumerate(STAGE_ORDER)}
+    for realm_index, realm in enumerate(REALM_ORDER)
+}
 
 DAYS_PER_YEAR = 365
 FOUNDATION_YEARS_TO_FILL = 5
 FOUNDATION_FILL_TICKS = DAYS_PER_YEAR * FOUNDATION_YEARS_TO_FILL
 
 SECONDS_PER_TICK = 60  # one real minute per tick
+YEARS_PER_SECOND = 1.0 / (SECONDS_PER_TICK * DAYS_PER_YEAR)  # one in-game day per tick
 STARTING_AGE_YEARS = 10
 REALM_LIFESPAN_YEARS: Dict[Realm, float] = {
     Realm.QI_CONDENSATION: 120,
@@ -68,45 +80,66 @@ class QiQuality(str, Enum):
     SUPERDENSE = "Superdense"
     EXTREMELY_DENSE = "Extremely dense"
 
-    order: ClassVar[List["QiQuality"]] = [
-        FAINT,
-        THIN,
-        STEADY,
-        THICK,
-        CONDENSED,
-        HIGHLY_CONCENTRATED,
-        SUPERDENSE,
-        EXTREMELY_DENSE,
-    ]
-
     @property
     def qi_per_day(self) -> float:
-        rates = {
-            QiQuality.FAINT: 1,
-            QiQuality.THIN: 2,
-            QiQuality.STEADY: 4,
-            QiQuality.THICK: 8,
-            QiQuality.CONDENSED: 16,
-            QiQuality.HIGHLY_CONCENTRATED: 32,
-            QiQuality.SUPERDENSE: 64,
-            QiQuality.EXTREMELY_DENSE: 128,
-        }
-        return float(rates[self])
+        return QI_PER_DAY[self]
 
     def is_lower_than(self, other: "QiQuality") -> bool:
-        return self.order.index(self) < self.order.index(other)
+        return QI_QUALITY_INDEX[self] < QI_QUALITY_INDEX[other]
+
+
+QI_QUALITY_ORDER: Tuple[QiQuality, ...] = tuple(QiQuality)
+QI_QUALITY_INDEX: Dict[QiQuality, int] = {quality: index for index, quality in enumerate(QI_QUALITY_ORDER)}
+
+
+# Each quality step doubles the qi gathered per day.
+QI_PER_DAY: Dict[QiQuality, float] = {
+    QiQuality.FAINT: 1.0,
+    QiQuality.THIN: 2.0,
+    QiQuality.STEADY: 4.0,
+    QiQuality.THICK: 8.0,
+    QiQuality.CONDENSED: 16.0,
+    QiQuality.HIGHLY_CONCENTRATED: 32.0,
+    QiQuality.SUPERDENSE: 64.0,
+    QiQuality.EXTREMELY_DENSE: 128.0,
+}
+
+
+# Value-to-member maps for decoding stored enum strings without the Enum call machinery.
+REALM_BY_VALUE: Dict[str, Realm] = {realm.value: realm for realm in Realm}
+STAGE_BY_VALUE: Dict[str, Stage] = {stage.value: stage for stage in Stage}
+QI_TYPE_BY_VALUE: Dict[str, QiType] = {qi_type.value: qi_type for qi_type in QiType}
+QI_QUALITY_BY_VALUE: Dict[str, QiQuality] = {quality.value: quality for quality in QiQuality}
 
 
 def default_timestamp() -> int:
     return int(time.time())
 
 
+# Players begin at 10 years old; one tick (60 seconds) counts as one in-game day.
+STARTING_AGE_SECONDS = int(STARTING_AGE_YEARS * DAYS_PER_YEAR * SECONDS_PER_TICK)
+
+
 def default_birthday() -> int:
-    # Players begin at 10 years old; one tick (60 seconds) counts as one in-game day.
-    return int(time.time()) - int(STARTING_AGE_YEARS * DAYS_PER_YEAR * SECONDS_PER_TICK)
+    return int(time.time()) - STARTING_AGE_SECONDS
+
+
+def ordinal(number: int) -> str:
+    suffix = "th"
+    if not 10 <= number % 100 <= 20:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+    return f"{number}{suffix}"
 
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def stage_label_for(realm: Realm, stage: Stage, layer: int) -> str:
+    """Display label for a cultivation position; there are only a few hundred of them."""
+    if realm is Realm.QI_CONDENSATION:
+        return f"{stage.value} {ordinal(layer)} layer"
+    return stage.value
+
+
+@dataclass(slots=True)
 class CultivationProgress:
     realm: Realm = Realm.QI_CONDENSATION
     stage: Stage = Stage.INITIAL
@@ -116,35 +149,26 @@ class CultivationProgress:
     qi_quality: QiQuality = QiQuality.FAINT
     cultivation_rate: float = 1.0  # percent per tick -> exp per tick
     foundation_progress: float = 0.0
+    # Clean tribulation passes since load; Player.apply_ticks turns the delta into a stat.
+    tribulations_overcome: int = field(default=0, init=False, repr=False, compare=False)
 
     max_qi_layers: ClassVar[int] = 15
 
     def __post_init__(self) -> None:
-        if isinstance(self.realm, str):
-            try:
-                self.realm = Realm(self.realm)
-            except ValueError:
-                self.realm = Realm.QI_CONDENSATION
-        if isinstance(self.stage, str):
-            try:
-                self.stage = Stage(self.stage)
-            except ValueError:
-                self.stage = Stage.INITIAL
+        # Loaded records carry plain strings; members pass through untouched.
+        if isinstance(self.realm, str) and not isinstance(self.realm, Realm):
+            self.realm = REALM_BY_VALUE.get(self.realm, Realm.QI_CONDENSATION)
+        if isinstance(self.stage, str) and not isinstance(self.stage, Stage):
+            self.stage = STAGE_BY_VALUE.get(self.stage, Stage.INITIAL)
         try:
             self.layer = int(self.layer)
         except (TypeError, ValueError):
             self.layer = 1
         self.layer = min(max(self.layer, 1), self.max_qi_layers)
-        if isinstance(self.qi_type, str):
-            try:
-                self.qi_type = QiType(self.qi_type)
-            except ValueError:
-                self.qi_type = QiType.SPIRITUAL
-        if isinstance(self.qi_quality, str):
-            try:
-                self.qi_quality = QiQuality(self.qi_quality)
-            except ValueError:
-                self.qi_quality = QiQuality.FAINT
+        if isinstance(self.qi_type, str) and not isinstance(self.qi_type, QiType):
+            self.qi_type = QI_TYPE_BY_VALUE.get(self.qi_type, QiType.SPIRITUAL)
+        if isinstance(self.qi_quality, str) and not isinstance(self.qi_quality, QiQuality):
+            self.qi_quality = QI_QUALITY_BY_VALUE.get(self.qi_quality, QiQuality.FAINT)
         try:
             self.foundation_progress = float(self.foundation_progress)
         except (TypeError, ValueError):
@@ -153,6 +177,18 @@ class CultivationProgress:
         self._upgrade_qi_quality_for_layer()
         self.refresh_cultivation_rate()
 
+    def to_dict(self) -> Dict:
+        return {
+            "realm": self.realm.value,
+            "stage": self.stage.value,
+            "layer": self.layer,
+            "exp": self.exp,
+            "qi_type": self.qi_type.value,
+            "qi_quality": self.qi_quality.value,
+            "cultivation_rate": self.cultivation_rate,
+            "foundation_progress": self.foundation_progress,
+        }
+
     def refresh_cultivation_rate(self) -> None:
         self.cultivation_rate = self.qi_gathering_rate()
 
@@ -177,36 +213,40 @@ class CultivationProgress:
         return remaining / self.cultivation_rate
 
     def required_exp(self) -> float:
-        base = (REALM_ORDER.index(self.realm) + 1) * 100
-        layer_multiplier = max(self.layer, 1)
-        stage_multiplier = (STAGE_ORDER.index(self.stage) + 1)
-        return base * layer_multiplier * stage_multiplier
+        return REQUIRED_EXP_BASE[self.realm][self.stage] * max(self.layer, 1)
 
     def add_exp(self, ticks: int) -> List[str]:
-        log: List[str] = []
         if self.is_maxed_out():
-            self.exp = min(self.exp + self.cultivation_rate * ticks, self.required_exp())
-            log.extend(self.update_foundation_progress(ticks))
-            return log
+            # Nothing lies beyond the final Peak: EXP just tops out, and the foundation bar
+            # only exists at the Qi Condensation cap.
+            required = self.required_exp()
+            if self.exp != required:
+                self.exp = min(self.exp + self.cultivation_rate * ticks, required)
+            return []
         self.exp += self.cultivation_rate * ticks
-        while self.exp >= self.required_exp():
-            self.exp -= self.required_exp()
+        required = self.required_exp()
+        if self.exp < required:
+            # Most ticks advance nothing; only the foundation bar can still move.
+            return self.update_foundation_progress(ticks)
+        log: List[str] = []
+        while self.exp >= required:
+            self.exp -= required
             log.append(self.advance_stage())
-            if self.is_qi_condensation_cap():
-                self.exp = min(self.exp, self.required_exp())
-                break
-            if self.is_maxed_out():
-                self.exp = min(self.exp, self.required_exp())
+            # Realm, stage and layer may all have moved; recompute once per advance.
+            required = self.required_exp()
+            # Both caps sit on the Peak stage, so earlier stages skip the cap checks.
+            if self.stage is Stage.PEAK and (self.is_qi_condensation_cap() or self.is_maxed_out()):
+                self.exp = min(self.exp, required)
                 break
         log.extend(self.update_foundation_progress(ticks))
         return log
 
     def advance_stage(self) -> str:
-        current_stage_index = STAGE_ORDER.index(self.stage)
-        if current_stage_index + 1 < len(STAGE_ORDER):
+        current_stage_index = STAGE_INDEX[self.stage]
+        if current_stage_index + 1 < STAGE_COUNT:
             self.stage = STAGE_ORDER[current_stage_index + 1]
             return f"Advanced to {self.stage_label()} of {self.realm.value}."
-        if self.realm == Realm.QI_CONDENSATION and self.layer < self.max_qi_layers:
+        if self.realm is Realm.QI_CONDENSATION and self.layer < self.max_qi_layers:
             self.layer += 1
             self.stage = Stage.INITIAL
             return self._handle_layer_advance()
@@ -225,37 +265,33 @@ class CultivationProgress:
         return f"Advanced to {self.stage_label()} of {self.realm.value}."
 
     def breakthrough_realm(self) -> str:
-        realm_index = REALM_ORDER.index(self.realm)
-        if realm_index + 1 < len(REALM_ORDER):
+        realm_index = REALM_INDEX[self.realm]
+        if realm_index + 1 < REALM_COUNT:
             tribulation = HeavenlyTribulation(self.realm, REALM_ORDER[realm_index + 1])
-            outcome = tribulation.resolve()
+            overcome, outcome = tribulation.resolve()
+            if overcome:
+                self.tribulations_overcome += 1
             self.realm = tribulation.target_realm
             self.stage = Stage.INITIAL
             return outcome
         self.stage = Stage.PEAK
-        if self.realm == Realm.QI_CONDENSATION:
+        if self.realm is Realm.QI_CONDENSATION:
             return f"Reached the pinnacle of {self.realm.value} (Peak {self.layer_ordinal()} layer)."
         return f"Reached the pinnacle of {self.realm.value} (Peak stage)."
 
     def layer_ordinal(self) -> str:
-        suffix = "th"
-        if not 10 <= self.layer % 100 <= 20:
-            suffix = {1: "st", 2: "nd", 3: "rd"}.get(self.layer % 10, "th")
-        return f"{self.layer}{suffix}"
+        return ordinal(self.layer)
 
     def stage_label(self) -> str:
-        if self.realm == Realm.QI_CONDENSATION:
-            return f"{self.stage.value} {self.layer_ordinal()} layer"
-        return self.stage.value
+        return stage_label_for(self.realm, self.stage, self.layer)
 
     def is_maxed_out(self) -> bool:
-        final_realm = REALM_ORDER[-1]
-        if self.realm == final_realm:
-            return self.stage == Stage.PEAK
+        if self.realm is FINAL_REALM:
+            return self.stage is Stage.PEAK
         return False
 
     def is_qi_condensation_cap(self) -> bool:
-        return self.realm == Realm.QI_CONDENSATION and self.layer >= self.max_qi_layers and self.stage == Stage.PEAK
+        return self.realm is Realm.QI_CONDENSATION and self.layer >= self.max_qi_layers and self.stage is Stage.PEAK
 
     def foundation_bar_active(self) -> bool:
         return self.is_qi_condensation_cap()
@@ -297,30 +333,51 @@ class CultivationProgress:
         return False, "Breakthrough failed. Your foundation wavers; you return to Late 15th layer Qi Condensation."
 
 
-@dataclass
+# (clean pass, close call) notes for a tribulation towards each realm.
+TRIBULATION_MESSAGES: Dict[Realm, Tuple[str, str]] = {
+    realm: (
+        f"Heavenly tribulation overcome! Broke through to {realm.value}.",
+        f"Tribulation clouds scatter—close call! {realm.value} awaits; cultivation steadies for the next attempt.",
+    )
+    for realm in Realm
+}
+
+
+@dataclass(slots=True)
 class HeavenlyTribulation:
     current_realm: Realm
     target_realm: Realm
     danger: float = 0.25
 
-    def resolve(self) -> str:
-        """Resolve a tribulation with a small chance of setback."""
+    def resolve(self) -> tuple[bool, str]:
+        """Resolve a tribulation with a small chance of setback; the flag is True on a clean pass."""
+        overcome, close_call = TRIBULATION_MESSAGES[self.target_realm]
         if random() < self.danger:
-            return (
-                f"Tribulation clouds scatter—close call! {self.target_realm.value} awaits; cultivation steadies for the next attempt."
-            )
-        return f"Heavenly tribulation overcome! Broke through to {self.target_realm.value}."
+            return False, close_call
+        return True, overcome
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerStats:
     enemies_defeated: int = 0
     tribulations_survived: int = 0
-    hours_cultivated: float = 0.0
+    hours_cultivated: int = 0  # in-game hours; every tick adds a whole day
     steps_travelled: int = 0
 
+    def __post_init__(self) -> None:
+        # Older saves stored the hour total as a float.
+        self.hours_cultivated = int(self.hours_cultivated)
 
-@dataclass
+    def to_dict(self) -> Dict:
+        return {
+            "enemies_defeated": self.enemies_defeated,
+            "tribulations_survived": self.tribulations_survived,
+            "hours_cultivated": self.hours_cultivated,
+            "steps_travelled": self.steps_travelled,
+        }
+
+
+@dataclass(slots=True)
 class TalentSheet:
     physical_strength: float = 100.0
     constitution: float = 100.0
@@ -333,6 +390,15 @@ class TalentSheet:
     average_threshold: ClassVar[float] = 75.0
     genius_threshold: ClassVar[float] = 100.0
 
+    def to_dict(self) -> Dict:
+        return {
+            "physical_strength": self.physical_strength,
+            "constitution": self.constitution,
+            "agility": self.agility,
+            "spiritual_power": self.spiritual_power,
+            "perception": self.perception,
+        }
+
     def multiplier(self, value: float) -> float:
         return max(value, 0.0) / 100.0
 
@@ -362,7 +428,7 @@ class TalentSheet:
         return max(cls.min_percent, min(value, cls.max_percent))
 
 
-@dataclass
+@dataclass(slots=True)
 class CoreStats:
     physical_strength: float = 10.0
     constitution: float = 10.0
@@ -370,17 +436,27 @@ class CoreStats:
     spiritual_power: float = 10.0
     perception: float = 10.0
 
+    def to_dict(self) -> Dict:
+        return {
+            "physical_strength": self.physical_strength,
+            "constitution": self.constitution,
+            "agility": self.agility,
+            "spiritual_power": self.spiritual_power,
+            "perception": self.perception,
+        }
+
     def effective(self, talents: TalentSheet) -> "CoreStats":
+        # Same arithmetic as TalentSheet.multiplier, inlined for the five stats.
         return CoreStats(
-            physical_strength=self.physical_strength * talents.multiplier(talents.physical_strength),
-            constitution=self.constitution * talents.multiplier(talents.constitution),
-            agility=self.agility * talents.multiplier(talents.agility),
-            spiritual_power=self.spiritual_power * talents.multiplier(talents.spiritual_power),
-            perception=self.perception * talents.multiplier(talents.perception),
+            physical_strength=self.physical_strength * (max(talents.physical_strength, 0.0) / 100.0),
+            constitution=self.constitution * (max(talents.constitution, 0.0) / 100.0),
+            agility=self.agility * (max(talents.agility, 0.0) / 100.0),
+            spiritual_power=self.spiritual_power * (max(talents.spiritual_power, 0.0) / 100.0),
+            perception=self.perception * (max(talents.perception, 0.0) / 100.0),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SubStats:
     hp: float
     defense: float
@@ -397,12 +473,15 @@ class SubStats:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EquipmentSlot:
     name: str
     item: str = ""
     description: str = ""
 
+    def to_dict(self) -> Dict:
+        return {"name": self.name, "item": self.item, "description": self.description}
+
 
 DEFAULT_SLOTS: Dict[str, EquipmentSlot] = {
     "weapon": EquipmentSlot(name="Weapon", item="", description="Empty hand"),
@@ -411,8 +490,17 @@ DEFAULT_SLOTS: Dict[str, EquipmentSlot] = {
     "ring": EquipmentSlot(name="Ring", item="", description="None"),
 }
 
+# Dict form of DEFAULT_SLOTS, built once; new players get shallow copies of each slot.
+DEFAULT_EQUIPMENT: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {key: MappingProxyType(slot.to_dict()) for key, slot in DEFAULT_SLOTS.items()}
+)
 
-@dataclass
+
+def default_equipment() -> Dict[str, Dict[str, str]]:
+    return {key: dict(slot) for key, slot in DEFAULT_EQUIPMENT.items()}
+
+
+@dataclass(slots=True)
 class Player:
     user_id: int
     name: str
@@ -423,9 +511,8 @@ class Player:
     talents: TalentSheet = field(default_factory=TalentSheet)
     cultivation: CultivationProgress = field(default_factory=CultivationProgress)
     inventory: List[str] = field(default_factory=list)
-    equipment: Dict[str, EquipmentSlot] = field(
-        default_factory=lambda: {k: dataclasses.asdict(v) for k, v in DEFAULT_SLOTS.items()}
-    )
+    # Slots are plain dicts shaped like EquipmentSlot.to_dict(), both fresh and loaded.
+    equipment: Dict[str, Dict[str, str]] = field(default_factory=default_equipment)
     last_tick_timestamp: int = field(default_factory=default_timestamp)
     world_id: str | None = None
     zone_id: str | None = None
@@ -435,75 +522,124 @@ class Player:
     time_flow_entry_timestamp: int | None = None
     time_flow_entry_world_id: str | None = None
     time_flow_entry_zone_id: str | None = None
+    # In-memory revision counter used to key render caches; never persisted.
+    version: int = field(default=0, repr=False, compare=False)
+    _rendered_inventory: str | None = field(default=None, init=False, repr=False, compare=False)
 
-    def age_years(
-        self, calendar: "GameCalendar", now: int | None = None, time_flow: float = 1.0
-    ) -> float:
-        now = now or int(time.time())
-        days_lived = calendar.days_elapsed(self.birthday, now) * max(time_flow, 0.0)
-        return days_lived / DAYS_PER_YEAR
+    def age_years(self, now: int | None = None, time_flow: float = 1.0) -> float:
+        if now is None:
+            now = int(time.time())
+        return max(now - self.birthday, 0) * max(time_flow, 0.0) * YEARS_PER_SECOND
 
     def effective_stats(self) -> CoreStats:
         return self.core_stats.effective(self.talents)
 
-    def sub_stats(self) -> SubStats:
-        return SubStats.from_effective(self.effective_stats())
+    def sub_stats(self, effective: CoreStats | None = None) -> SubStats:
+        return SubStats.from_effective(effective if effective is not None else self.effective_stats())
 
     def lifespan_years(self) -> float:
         return REALM_LIFESPAN_YEARS.get(self.cultivation.realm, REALM_LIFESPAN_YEARS[Realm.QI_CONDENSATION])
 
-    def remaining_lifespan_years(
-        self, calendar: "GameCalendar", now: int | None = None, time_flow: float = 1.0
-    ) -> float:
-        return max(self.lifespan_years() - self.age_years(calendar, now, time_flow), 0.0)
+    def remaining_lifespan_years(self, now: int | None = None, time_flow: float = 1.0) -> float:
+        return max(self.lifespan_years() - self.age_years(now, time_flow), 0.0)
+
+    @property
+    def rendered_inventory(self) -> str:
+        """Bulleted inventory listing, rebuilt only after add_item/remove_item."""
+        if self._rendered_inventory is None:
+            self._rendered_inventory = "\n".join(f"• {item}" for item in self.inventory)
+        return self._rendered_inventory
+
+    def add_item(self, item: str) -> None:
+        self.inventory.append(item)
+        self._rendered_inventory = None
+
+    def remove_item(self, item: str) -> bool:
+        try:
+            self.inventory.remove(item)
+        except ValueError:
+            return False
+        self._rendered_inventory = None
+        return True
 
     def apply_ticks(self, ticks: int) -> List[str]:
         self.stats.hours_cultivated += ticks * 24
-        logs = self.cultivation.add_exp(ticks)
-        for note in logs:
-            lowered = note.lower()
-            if "tribulation" in lowered and "overcome" in lowered:
-                self.stats.tribulations_survived += 1
+        cultivation = self.cultivation
+        overcome_before = cultivation.tribulations_overcome
+        logs = cultivation.add_exp(ticks)
+        self.stats.tribulations_survived += cultivation.tribulations_overcome - overcome_before
         return logs
 
     def to_dict(self) -> Dict:
-        data = dataclasses.asdict(self)
-        for key in ("world_id", "zone_id"):
-            if data.get(key) is None:
-                data.pop(key, None)
+        data = {
+            "user_id": self.user_id,
+            "name": self.name,
+            "created_at": self.created_at,
+            "birthday": self.birthday,
+            "stats": self.stats.to_dict(),
+            "core_stats": self.core_stats.to_dict(),
+            "talents": self.talents.to_dict(),
+            "cultivation": self.cultivation.to_dict(),
+            "inventory": list(self.inventory),
+            "equipment": {key: dict(slot) for key, slot in self.equipment.items()},
+            "last_tick_timestamp": self.last_tick_timestamp,
+        }
+        # Optional location fields are omitted while unset, as TOML has no null.
+        if self.world_id is not None:
+            data["world_id"] = self.world_id
+        if self.zone_id is not None:
+            data["zone_id"] = self.zone_id
+        data["position_x"] = self.position_x
+        data["position_y"] = self.position_y
+        data["tick_buffer"] = self.tick_buffer
+        if self.time_flow_entry_timestamp is not None:
+            data["time_flow_entry_timestamp"] = self.time_flow_entry_timestamp
+        if self.time_flow_entry_world_id is not None:
+            data["time_flow_entry_world_id"] = self.time_flow_entry_world_id
+        if self.time_flow_entry_zone_id is not None:
+            data["time_flow_entry_zone_id"] = self.time_flow_entry_zone_id
         return data
 
     @staticmethod
     def from_dict(data: Dict) -> "Player":
+        get = data.get
+        # Stored records always carry the timestamps; only fall back to the clock when one is missing.
+        created_at = get("created_at")
+        birthday = get("birthday")
+        last_tick_timestamp = get("last_tick_timestamp")
+        equipment = get("equipment")
         return Player(
             user_id=data["user_id"],
-            name=data.get("name", "Unnamed"),
-            created_at=data.get("created_at", default_timestamp()),
-            birthday=data.get("birthday", default_birthday()),
-            stats=PlayerStats(**data.get("stats", {})),
-            core_stats=CoreStats(**data.get("core_stats", {})),
-            talents=TalentSheet(**data.get("talents", {})),
-            cultivation=CultivationProgress(**data.get("cultivation", {})),
-            inventory=list(data.get("inventory", [])),
-            equipment={k: EquipmentSlot(**v) for k, v in data.get("equipment", {}).items()}
-            if data.get("equipment")
-            else {k: dataclasses.asdict(v) for k, v in DEFAULT_SLOTS.items()},
-            last_tick_timestamp=data.get("last_tick_timestamp", default_timestamp()),
-            world_id=data.get("world_id"),
-            zone_id=data.get("zone_id"),
-            position_x=int(data.get("position_x", 0)),
-            position_y=int(data.get("position_y", 0)),
-            tick_buffer=float(data.get("tick_buffer", 0.0)),
-            time_flow_entry_timestamp=data.get("time_flow_entry_timestamp"),
-            time_flow_entry_world_id=data.get("time_flow_entry_world_id"),
-            time_flow_entry_zone_id=data.get("time_flow_entry_zone_id"),
+            name=get("name", "Unnamed"),
+            created_at=default_timestamp() if created_at is None else created_at,
+            birthday=default_birthday() if birthday is None else birthday,
+            stats=PlayerStats(**get("stats", {})),
+            core_stats=CoreStats(**get("core_stats", {})),
+            talents=TalentSheet(**get("talents", {})),
+            cultivation=CultivationProgress(**get("cultivation", {})),
+            inventory=list(get("inventory", [])),
+            equipment={k: dict(v) for k, v in equipment.items()} if equipment else default_equipment(),
+            last_tick_timestamp=default_timestamp() if last_tick_timestamp is None else last_tick_timestamp,
+            world_id=get("world_id"),
+            zone_id=get("zone_id"),
+            position_x=int(get("position_x", 0)),
+            position_y=int(get("position_y", 0)),
+            tick_buffer=float(get("tick_buffer", 0.0)),
+            time_flow_entry_timestamp=get("time_flow_entry_timestamp"),
+            time_flow_entry_world_id=get("time_flow_entry_world_id"),
+            time_flow_entry_zone_id=get("time_flow_entry_zone_id"),
         )
 
 
+_SLUG_SEPARATORS = re.compile(r"[^a-zA-Z0-9]+")
+
+
 def slugify(name: str) -> str:
-    slug = re.sub(r"[^a-zA-Z0-9]+", "-", name).strip("-").lower()
+    slug = _SLUG_SEPARATORS.sub("-", name).strip("-").lower()
     return slug or "world"
-@dataclass
+
+
+@dataclass(slots=True)
 class World:
     id: str
     name: str
@@ -511,8 +647,17 @@ class World:
     beginning: bool = False
     time_flow: float = 1.0
 
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "current_location_role_id": self.current_location_role_id,
+            "beginning": self.beginning,
+            "time_flow": self.time_flow,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Zone:
     id: str
     world_id: str
@@ -524,3 +669,16 @@ class Zone:
     beginning: bool = False
     time_flow: float = 1.0
 
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "world_id": self.world_id,
+            "name": self.name,
+            "channel_id": self.channel_id,
+            "current_location_role_id": self.current_location_role_id,
+            "x_size": self.x_size,
+            "y_size": self.y_size,
+            "beginning": self.beginning,
+            "time_flow": self.time_flow,
+        }
+
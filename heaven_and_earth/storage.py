@@ -1,8 +1,8 @@
-import dataclasses
+import json
 import os
 import sys
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, Optional
 
 import tomli_w
 
@@ -11,6 +11,11 @@ if sys.version_info >= (3, 11):  # pragma: no cover - runtime guard for stdlib a
 else:  # pragma: no cover
     import tomli as tomllib
 
+try:  # pragma: no cover - optional faster encoder
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from .models import Player, TalentSheet, World, Zone
 
 
@@ -18,23 +23,70 @@ class PlayerRepository:
     def __init__(self, data_dir: str = ".data") -> None:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.path = self.data_dir / "players.toml"
-        if not self.path.exists():
-            self.path.write_text("[players]\n", encoding="utf-8")
+        self.path = self.data_dir / "players.json"
+        # Earlier releases stored players as TOML; it is read once if no JSON store exists yet.
+        self.legacy_path = self.data_dir / "players.toml"
+        if not self.path.exists() and not self.legacy_path.exists():
+            self.path.write_text('{"players":{}}', encoding="utf-8")
+        # Encoded JSON member per player; only the records named in save_many are re-encoded.
+        self._fragments: Optional[Dict[int, str]] = None
 
     def load_all(self) -> Dict[int, Player]:
-        content = self.path.read_text(encoding="utf-8")
-        raw = tomllib.loads(content) if content.strip() else {}
-        players_data = raw.get("players", {})
-        return {int(k): Player.from_dict(v) for k, v in players_data.items()}
+        if self.path.exists():
+            content = self.path.read_text(encoding="utf-8")
+            raw = json.loads(content) if content.strip() else {}
+        else:
+            content = self.legacy_path.read_text(encoding="utf-8")
+            raw = tomllib.loads(content) if content.strip() else {}
+        players_data = raw.pop("players", {})
+        del raw, content
+        self._fragments = None
+        players: Dict[int, Player] = {}
+        # Pop each raw record as it is converted so the parsed tree shrinks while Players are built.
+        for key in list(players_data):
+            players[int(key)] = Player.from_dict(players_data.pop(key))
+        return players
 
     def save_all(self, players: Dict[int, Player]) -> None:
-        serialisable = {str(uid): player.to_dict() for uid, player in players.items()}
-        payload = {"players": serialisable}
+        self.write(self.encode_all(players))
+
+    def save_many(self, players: Dict[int, Player], user_ids: Iterable[int]) -> None:
+        self.write(self.encode_many(players, user_ids))
+
+    def encode_all(self, players: Dict[int, Player]) -> str:
+        self._fragments = {uid: self._encode(uid, player) for uid, player in players.items()}
+        return self._join()
+
+    def encode_many(self, players: Dict[int, Player], user_ids: Iterable[int]) -> str:
+        """Encode the given players, reusing the cached encoding of everyone else."""
+        if self._fragments is None:
+            return self.encode_all(players)
+        for uid in user_ids:
+            player = players.get(uid)
+            if player is None:
+                self._fragments.pop(uid, None)
+            else:
+                self._fragments[uid] = self._encode(uid, player)
+        return self._join()
+
+    def write(self, content: str) -> None:
+        """Atomically replace the player file; safe to call from a worker thread."""
         tmp_path = self.path.with_suffix(".tmp")
-        tmp_path.write_text(tomli_w.dumps(payload), encoding="utf-8")
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(content)
+            handle.flush()
+            os.fsync(handle.fileno())
         os.replace(tmp_path, self.path)
 
+    @staticmethod
+    def _encode(uid: int, player: Player) -> str:
+        if orjson is not None:
+            return f'"{uid}":' + orjson.dumps(player.to_dict()).decode("utf-8")
+        return f'"{uid}":' + json.dumps(player.to_dict(), separators=(",", ":"))
+
+    def _join(self) -> str:
+        return '{"players":{' + ",".join(self._fragments.values() if self._fragments else ()) + "}}"
+
     def create_player(self, players: Dict[int, Player], user_id: int, user_name: str) -> Player:
         player = Player(user_id=user_id, name=user_name, talents=TalentSheet.roll())
         players[user_id] = player
@@ -59,10 +111,21 @@ class WorldRepository:
         return worlds, zones
 
     def save_all(self, worlds: Dict[str, World], zones: Dict[str, Zone]) -> None:
+        self.write(self.encode_all(worlds, zones))
+
+    @staticmethod
+    def encode_all(worlds: Dict[str, World], zones: Dict[str, Zone]) -> str:
         payload = {
-            "worlds": {wid: dataclasses.asdict(world) for wid, world in worlds.items()},
-            "zones": {zid: dataclasses.asdict(zone) for zid, zone in zones.items()},
+            "worlds": {wid: world.to_dict() for wid, world in worlds.items()},
+            "zones": {zid: zone.to_dict() for zid, zone in zones.items()},
         }
+        return tomli_w.dumps(payload)
+
+    def write(self, content: str) -> None:
+        """Atomically replace the world file; safe to call from a worker thread."""
         tmp_path = self.path.with_suffix(".tmp")
-        tmp_path.write_text(tomli_w.dumps(payload), encoding="utf-8")
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(content)
+            handle.flush()
+            os.fsync(handle.fileno())
         os.replace(tmp_path, self.path)